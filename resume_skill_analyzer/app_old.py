@@ -18,7 +18,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'nlp_modules'))
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
 from nlp_modules.skill_extractor import SkillExtractor
-from utils.pdf_extractor import PDFExtractor
+from utils.streamlit_extractor import StreamlitPDFExtractor
+from utils.upload_buffer import UploadBuffer
 from utils.skill_analyzer import SkillAnalyzer
 
 # Page configuration
@@ -854,7 +855,7 @@ def main():
         
         # Extract text from uploaded file
         with st.spinner("📄 Extracting text from resume..."):
-            resume_text = PDFExtractor.extract_text_from_uploaded_file(uploaded_file)
+            resume_text = StreamlitPDFExtractor.extract_text_from_buffer(UploadBuffer.from_upload(uploaded_file))
             
             if resume_text is None or resume_text.strip() == "":
                 st.error("❌ Failed to extract text from the uploaded file. The file might be corrupted or empty. Please try a different file.")
@@ -870,7 +871,8 @@ def main():
         with st.spinner("🧠 Analyzing skills with NLP..."):
             try:
                 # Extract skills from resume
-                resume_skills = skill_extractor.extract_skills_combined(resume_text)
+                resume_skill_set = skill_extractor.extract_skill_set(resume_text)
+                resume_skills = resume_skill_set.to_dict()
                 
                 # Validate extracted skills
                 if not resume_skills:
@@ -886,8 +888,10 @@ def main():
                     return
                 
                 # Perform skill gap analysis
-                skill_analyzer = SkillAnalyzer()
-                analysis_results = skill_analyzer.analyze_skill_gaps(resume_skills, required_skills)
+                skill_analyzer = SkillAnalyzer(
+                    skill_extractor.job_skills_data['job_roles'], skill_extractor.skill_registry
+                )
+                analysis_results = skill_analyzer.analyze_skill_gaps(resume_skill_set, required_skills)
                 
                 # Validate analysis results
                 if not analysis_results:
@@ -895,9 +899,9 @@ def main():
                     return
                 
                 # Get category analysis
-                skill_categories = skill_extractor.categorize_skills(list(resume_skills.keys()))
+                skill_categories = skill_extractor.categorize_skills(resume_skill_set)
                 category_analysis = skill_analyzer.get_skill_category_analysis(
-                    resume_skills, required_skills, skill_extractor.job_skills_data['technical_skills_database']
+                    resume_skill_set, required_skills, skill_extractor.job_skills_data['technical_skills_database']
                 )
                 
                 # Store results
@@ -0,0 +1,260 @@
+"""
+Batch Resume Screening
+Scores a directory or glob of PDF/TXT resumes against job roles without the
+Streamlit UI and streams one JSON line per resume.
+
+Usage (from the repository root):
+    python -m resume_skill_analyzer.batch resumes/ --role "Data Scientist" --workers 8
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Add modules to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.analysis_engine import get_analysis_engine
+from utils.result_cache import get_result_cache
+from utils.resume_pipeline import analyze_roles, extract_resume_skills
+from utils.single_flight import SingleFlight, get_single_flight, single_flight_stats
+from utils.upload_buffer import UploadBuffer
+from utils.worker_pool import DEFAULT_MAX_TASKS_PER_CHILD, EngineWorkerPool
+
+DEFAULT_JOB_SKILLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'job_skills.json')
+RESUME_EXTENSIONS = ('.pdf', '.txt')
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+def iter_resume_paths(inputs: List[str]) -> Iterator[str]:
+    """
+    Expand directories, globs and file paths into resume files
+
+    Args:
+        inputs: Directories (searched recursively), glob patterns or files
+
+    Returns:
+        Iterator of unique PDF/TXT paths, in sorted order per input
+    """
+    seen = set()
+    for entry in inputs:
+        if os.path.isdir(entry):
+            paths = (
+                os.path.join(root, name)
+                for root, _, names in sorted(os.walk(entry))
+                for name in sorted(names)
+            )
+        elif glob.has_magic(entry):
+            paths = sorted(glob.iglob(entry, recursive=True))
+        else:
+            paths = [entry]
+
+        for path in paths:
+            if path.lower().endswith(RESUME_EXTENSIONS) and os.path.isfile(path) and path not in seen:
+                seen.add(path)
+                yield path
+
+
+def analyze_resume_path(path: str, job_skills_path: str, roles: List[str]) -> Dict:
+    """
+    Extract and analyze one resume file
+
+    Args:
+        path: Resume file path
+        job_skills_path: Path to job_skills.json
+        roles: Job roles to analyze against
+
+    Returns:
+        JSON-serializable result record
+    """
+    record = {'file': path}
+    try:
+        engine = get_analysis_engine(job_skills_path)
+        with open(path, 'rb') as f:
+            upload = UploadBuffer.from_upload(f)
+        record['sha256'] = upload.content_hash()
+
+        extracted = extract_resume_skills(upload, engine, get_result_cache())
+        if extracted['warnings']:
+            record['warnings'] = extracted['warnings']
+        if 'error' in extracted:
+            record['error'] = extracted['error']
+            return record
+
+        record['skills_found'] = len(extracted['skills'])
+        record['roles'] = analyze_roles(engine, extracted['skills'], roles)
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+    return record
+
+
+# Arguments of the current batch run, set in every worker process
+_worker_args = None
+
+
+def _init_worker(job_skills_path: str, roles: List[str]):
+    """Record the run's arguments; the engine itself comes from EngineWorkerPool"""
+    global _worker_args
+    _worker_args = (job_skills_path, roles)
+
+
+def _analyze_to_json(path: str) -> str:
+    """Pool task: analyze one resume and serialize it in the worker"""
+    return json.dumps(analyze_resume_path(path, *_worker_args))
+
+
+def _analyze_path_to_json(path: str) -> Tuple[str, str]:
+    """Pool task: like _analyze_to_json, returning the path alongside the line"""
+    return path, _analyze_to_json(path)
+
+
+def file_content_hash(path: str) -> str:
+    """SHA-256 hex digest of a file, matching UploadBuffer.content_hash"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _copy_line_for(line: str, path: str) -> str:
+    """Reuse another file's result line for an identical file"""
+    record = json.loads(line)
+    record['file'] = path
+    return json.dumps(record)
+
+
+def run_batch(paths: Iterator[str], job_skills_path: str, roles: List[str],
+              workers: int = 1, chunksize: int = 4,
+              max_tasks_per_child: Optional[int] = DEFAULT_MAX_TASKS_PER_CHILD,
+              flight: Optional[SingleFlight] = None) -> Iterator[str]:
+    """
+    Analyze resumes, yielding one JSON line per resume as results complete
+
+    With several workers, a file whose content is identical to one still
+    being analyzed is not sent to a worker; it receives a copy of that
+    file's result line instead.
+
+    Args:
+        paths: Resume file paths
+        job_skills_path: Path to job_skills.json
+        roles: Job roles to analyze against
+        workers: Number of worker processes (1 runs in this process)
+        chunksize: Resumes sent to a worker per task
+        max_tasks_per_child: Tasks after which a worker is replaced
+        flight: SingleFlight keyed by content hash, for its counters
+
+    Returns:
+        Iterator of JSON strings, in completion order when workers > 1
+    """
+    if workers <= 1:
+        _init_worker(job_skills_path, roles)
+        for path in paths:
+            yield _analyze_to_json(path)
+        return
+
+    if flight is None:
+        flight = SingleFlight()
+    leader_keys: Dict[str, str] = {}  # Path sent to a worker -> its content hash
+    follower_lines: List[str] = []  # Lines for identical files, added by done callbacks
+
+    def leader_paths() -> Iterator[str]:
+        # Runs in the pool's task feeder thread
+        for path in paths:
+            try:
+                key = file_content_hash(path)
+            except OSError:
+                yield path  # The worker reports the error
+                continue
+            future, leader = flight.claim(key)
+            if leader:
+                leader_keys[path] = key
+                yield path
+            else:
+                future.add_done_callback(
+                    lambda done, path=path: follower_lines.append(_copy_line_for(done.result(), path))
+                )
+
+    with EngineWorkerPool(job_skills_path, workers, max_tasks_per_child,
+                          initializer=_init_worker, initargs=(job_skills_path, roles)) as pool:
+        for path, line in pool.imap_unordered(_analyze_path_to_json, leader_paths(), chunksize):
+            yield line
+            key = leader_keys.pop(path, None)
+            if key is not None:
+                flight.resolve(key, line)
+            while follower_lines:
+                yield follower_lines.pop()
+    while follower_lines:
+        yield follower_lines.pop()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m resume_skill_analyzer.batch',
+        description="Score PDF/TXT resumes against job roles and print one JSON line per resume."
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help="Resume directories (searched recursively), glob patterns or files")
+    parser.add_argument('--role', dest='roles', action='append', metavar='ROLE',
+                        help="Job role from job_skills.json; repeat for several roles (default: all roles)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of worker processes (default: 1)")
+    parser.add_argument('--chunksize', type=int, default=4,
+                        help="Resumes sent to a worker per task (default: 4)")
+    parser.add_argument('--max-tasks-per-child', type=int, default=DEFAULT_MAX_TASKS_PER_CHILD,
+                        help="Tasks a worker runs before it is replaced; 0 never replaces workers "
+                             f"(default: {DEFAULT_MAX_TASKS_PER_CHILD})")
+    parser.add_argument('--job-skills', default=DEFAULT_JOB_SKILLS_PATH,
+                        help="Path to job_skills.json")
+    parser.add_argument('--output', '-o', default='-',
+                        help="Output JSON Lines file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    with open(args.job_skills, 'r') as f:
+        available_roles = list(json.load(f)['job_roles'])
+    roles = args.roles or available_roles
+    unknown_roles = [role for role in roles if role not in available_roles]
+    if unknown_roles:
+        print(f"Unknown job role(s): {', '.join(unknown_roles)}. "
+              f"Available roles: {', '.join(available_roles)}", file=sys.stderr)
+        return 2
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    flight = get_single_flight('batch_files')
+    start = time.perf_counter()
+    count = 0
+    try:
+        for line in run_batch(iter_resume_paths(args.inputs), args.job_skills, roles,
+                              args.workers, args.chunksize, args.max_tasks_per_child or None,
+                              flight):
+            output.write(line + '\n')
+            count += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Analyzed {count} resumes in {elapsed:.1f} s", file=sys.stderr)
+    # Extraction flights are only counted here when there are no workers
+    flights = {name: stats for name, stats in single_flight_stats().items() if stats['calls']}
+    if flights:
+        print("Coalesced (saved/calls): " + ", ".join(
+            f"{name} {stats['saved']}/{stats['calls']}" for name, stats in sorted(flights.items())
+        ), file=sys.stderr)
+    if count == 0:
+        print("No PDF or TXT resumes found.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Benchmark: TextProcessor.clean_text on 1 KB - 1 MB inputs
+Compares the previous two-regex cleaning with the translate-table version.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_clean_text.py
+"""
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nlp_modules.text_processor import TextProcessor
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'samples', 'sample_resume.txt')
+SIZES = [1024, 16 * 1024, 128 * 1024, 1024 * 1024]
+
+
+def regex_clean_text(text: str) -> str:
+    """Previous implementation of clean_text"""
+    text = re.sub(r'[^\w\s\-\.\+\#\/]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.lower().strip()
+
+
+def best_time(func, text: str, repeat: int = 5) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    processor = TextProcessor()
+    with open(SAMPLE_PATH, 'r') as f:
+        sample = f.read()
+
+    print(f"{'size':>10} {'regex ms':>10} {'translate ms':>13} {'speedup':>8}")
+    for size in SIZES:
+        text = (sample * (size // len(sample) + 1))[:size]
+        assert regex_clean_text(text) == processor.clean_text(text)
+        before = best_time(regex_clean_text, text)
+        after = best_time(processor.clean_text, text)
+        print(f"{size:>10} {before:>10.3f} {after:>13.3f} {before / after:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Benchmark: engine setup cost paid on every Streamlit rerun
+Compares rebuilding SkillExtractor/SkillAnalyzer per rerun with the shared engine.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_engine_cache.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nlp_modules.skill_extractor import SkillExtractor
+from utils.analysis_engine import get_analysis_engine
+from utils.skill_analyzer import SkillAnalyzer
+
+JOB_SKILLS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'job_skills.json')
+RERUNS = 20
+
+
+def rebuild_per_rerun():
+    """Previous behaviour: construct the extractor and analyzer on every rerun"""
+    skill_extractor = SkillExtractor(JOB_SKILLS_PATH)
+    SkillAnalyzer(skill_extractor.job_skills_data['job_roles'], skill_extractor.skill_registry)
+
+
+def shared_engine():
+    """Current behaviour: look up the process-wide engine"""
+    get_analysis_engine(JOB_SKILLS_PATH)
+
+
+def time_per_rerun(func) -> float:
+    """Average wall time of one simulated rerun in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        func()
+    return (time.perf_counter() - start) / RERUNS * 1000
+
+
+def main() -> int:
+    start = time.perf_counter()
+    get_analysis_engine(JOB_SKILLS_PATH)
+    first_build = (time.perf_counter() - start) * 1000
+
+    before = time_per_rerun(rebuild_per_rerun)
+    after = time_per_rerun(shared_engine)
+
+    print(f"first engine build     : {first_build:8.2f} ms (once per process)")
+    print(f"rebuild on every rerun : {before:8.2f} ms")
+    print(f"shared engine per rerun: {after:8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
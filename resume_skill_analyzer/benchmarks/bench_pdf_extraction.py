@@ -0,0 +1,109 @@
+"""
+Benchmark: page-wise PDF extraction on a long synthetic PDF
+Checks that streaming extraction matches reading every page into one
+string, and reports the time to the first page and the effect of limits.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_pdf_extraction.py
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import PyPDF2
+
+from utils.pdf_extractor import PDFExtractor
+
+NUM_PAGES = 200
+LINES_PER_PAGE = 40
+
+
+def build_pdf(num_pages: int) -> bytes:
+    """Write a minimal multi-page PDF with one text stream per page"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_refs = []
+    for page_num in range(num_pages):
+        lines = [
+            f"({page_num} python sql docker kubernetes machine learning line {line}) Tj 0 -14 Td"
+            for line in range(LINES_PER_PAGE)
+        ]
+        content = ("BT /F1 10 Tf 40 780 Td " + " ".join(lines) + " ET").encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_refs.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(page_refs), num_pages)
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref_offset = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+              % (len(objects) + 1, xref_offset))
+    return out.getvalue()
+
+
+def extract_concatenating(pdf_bytes: bytes) -> str:
+    """Previous behaviour: copy the upload and grow one string with +="""
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    text = ""
+    for page in pdf_reader.pages:
+        page_text = page.extract_text()
+        if page_text.strip():
+            text += page_text + "\n"
+    return text.strip()
+
+
+def main() -> int:
+    pdf_bytes = build_pdf(NUM_PAGES)
+
+    start = time.perf_counter()
+    expected = extract_concatenating(pdf_bytes)
+    concatenating = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pages = PDFExtractor.iter_page_texts(io.BytesIO(pdf_bytes))
+    next(pages)
+    first_page = time.perf_counter() - start
+
+    start = time.perf_counter()
+    text = PDFExtractor.extract_pdf(io.BytesIO(pdf_bytes), None, None, None).text
+    streaming = time.perf_counter() - start
+
+    start = time.perf_counter()
+    limited_pages, stop_reason = PDFExtractor.collect_page_texts(
+        PDFExtractor.iter_page_texts(io.BytesIO(pdf_bytes), max_pages=10, max_chars=20_000,
+                                     page_time_budget=1.0)
+    )
+    limited = time.perf_counter() - start
+
+    print(f"{NUM_PAGES} pages, {len(pdf_bytes) / 1024:.0f} KB")
+    print(f"concatenate all pages  : {concatenating * 1000:8.1f} ms")
+    print(f"stream all pages       : {streaming * 1000:8.1f} ms")
+    print(f"first page available   : {first_page * 1000:8.1f} ms")
+    print(f"with limits            : {limited * 1000:8.1f} ms "
+          f"({len(limited_pages)} pages, stopped: {stop_reason})")
+
+    if text != expected:
+        print("FAIL: streamed text differs from the concatenated text")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Benchmark: serial versus process-pool PDF extraction by page count
+Finds the page count from which the pool pays for its startup cost; use it
+to tune utils.pdf_extractor.PARALLEL_PAGE_THRESHOLD on the target hardware.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_pdf_parallel.py [workers]
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bench_pdf_extraction import build_pdf
+from utils.pdf_extractor import PDFExtractor, PARALLEL_PAGE_THRESHOLD
+
+PAGE_COUNTS = [2, 4, 8, 16, 32, 64, 128, 256]
+REPEAT = 3
+
+
+def extract(pdf_bytes: bytes, parallel: bool, workers: int) -> tuple:
+    """Best-of-N wall time and page texts of one extraction"""
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        page_texts, _ = PDFExtractor.collect_page_texts(PDFExtractor.iter_page_texts(
+            io.BytesIO(pdf_bytes), parallel=parallel, max_workers=workers, parallel_threshold=1
+        ))
+        best = min(best, time.perf_counter() - start)
+    return best, page_texts
+
+
+def main() -> int:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    print(f"{workers} workers, configured threshold {PARALLEL_PAGE_THRESHOLD} pages")
+    print(f"{'pages':>6} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+
+    ok = True
+    faster = []
+    for num_pages in PAGE_COUNTS:
+        pdf_bytes = build_pdf(num_pages)
+        serial, serial_pages = extract(pdf_bytes, False, workers)
+        parallel, parallel_pages = extract(pdf_bytes, True, workers)
+        if parallel_pages != serial_pages:
+            print(f"FAIL: parallel pages differ from serial pages at {num_pages} pages")
+            ok = False
+        faster.append(parallel < serial)
+        print(f"{num_pages:>6} {serial * 1000:>10.1f} {parallel * 1000:>12.1f} {serial / parallel:>7.2f}x")
+
+    # Smallest page count from which the pool stays faster
+    crossover = None
+    for num_pages, is_faster in reversed(list(zip(PAGE_COUNTS, faster))):
+        if not is_faster:
+            break
+        crossover = num_pages
+
+    if crossover is None:
+        print("parallel extraction never beat serial extraction on this machine")
+    else:
+        print(f"crossover: parallel is faster from {crossover} pages")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Benchmark: identical uploads from concurrent sessions
+Starts several threads (standing in for Streamlit sessions) that submit the
+same resume at once, and compares independent extraction with the
+single-flight path in utils.resume_pipeline.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_single_flight.py [sessions]
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.analysis_engine import get_analysis_engine
+from utils.result_cache import ResultCache, make_cache_key
+from utils.resume_pipeline import extract_resume_skills
+from utils.single_flight import get_single_flight
+from utils.upload_buffer import UploadBuffer
+
+JOB_SKILLS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'job_skills.json')
+SAMPLE_RESUME_PATH = os.path.join(os.path.dirname(__file__), '..', 'samples', 'sample_resume.txt')
+SESSIONS = 8
+# Repeat the sample so one extraction takes long enough for sessions to overlap
+SAMPLE_REPEATS = 20
+
+
+def run_sessions(session: Callable[[], dict], sessions: int) -> List[dict]:
+    """Run session() in that many threads released together; return their results"""
+    barrier = threading.Barrier(sessions)
+    results = [None] * sessions
+
+    def run(index: int):
+        barrier.wait()
+        results[index] = session()
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def main() -> int:
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else SESSIONS
+    engine = get_analysis_engine(JOB_SKILLS_PATH)
+    engine.warm_up()
+    with open(SAMPLE_RESUME_PATH, 'rb') as f:
+        data = f.read() * SAMPLE_REPEATS
+
+    def independent() -> dict:
+        """Previous behaviour: every session that misses the cache extracts"""
+        upload = UploadBuffer(data)
+        cache_key = make_cache_key(upload.content_hash(), engine.fingerprint)
+        cached_result = independent_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+        text = upload.decode_text()[0]
+        result = {'text': text, 'skills': engine.skill_extractor.extract_skills_combined(text)}
+        independent_cache.put(cache_key, result)
+        return result
+
+    def coalesced() -> dict:
+        return extract_resume_skills(UploadBuffer(data), engine, coalesced_cache)
+
+    independent_cache = ResultCache()
+    start = time.perf_counter()
+    expected = run_sessions(independent, sessions)
+    independent_time = time.perf_counter() - start
+
+    coalesced_cache = ResultCache()
+    start = time.perf_counter()
+    results = run_sessions(coalesced, sessions)
+    coalesced_time = time.perf_counter() - start
+    stats = get_single_flight('resume_extraction').stats()
+
+    print(f"{sessions} concurrent sessions, {len(data) / 1024:.0f} KB resume")
+    print(f"independent extraction : {independent_time * 1000:7.1f} ms, "
+          f"{independent_cache.misses} extractions")
+    print(f"single flight          : {coalesced_time * 1000:7.1f} ms, "
+          f"{stats['executions']} extractions, {stats['saved']} saved")
+
+    if any(result['skills'] != expected[0]['skills'] for result in results):
+        print("FAIL: coalesced sessions returned different skills")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Benchmark: keyword skill matching cost versus dictionary size
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_skill_matcher.py
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nlp_modules.skill_matcher import SkillMatcher
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'samples', 'sample_resume.txt')
+DICTIONARY_SIZES = [100, 1000, 10000, 50000]
+MAX_GROWTH = 3.0  # Allowed slowdown from the smallest to the largest dictionary
+
+
+def synthetic_skills(size: int, seed: int = 0) -> dict:
+    """Generate random multi-word skills that rarely occur in real text"""
+    rng = random.Random(seed)
+    skills = {}
+    while len(skills) < size:
+        words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+                 for _ in range(rng.randint(1, 3))]
+        skill = ' '.join(words)
+        skills[skill] = [skill]
+    return skills
+
+
+def time_matcher(matcher: SkillMatcher, text: str, tokens: list, repeat: int = 5) -> float:
+    """Return the best-of-N wall time for one count_skills call"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        matcher.count_skills(text, tokens)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    with open(SAMPLE_PATH, 'r') as f:
+        text = f.read().lower()
+    tokens = text.split()
+
+    timings = []
+    for size in DICTIONARY_SIZES:
+        matcher = SkillMatcher(synthetic_skills(size))
+        elapsed = time_matcher(matcher, text, tokens)
+        timings.append(elapsed)
+        print(f"{size:>7} skills: {elapsed * 1000:8.2f} ms per resume")
+
+    growth = timings[-1] / timings[0]
+    print(f"growth {DICTIONARY_SIZES[0]} -> {DICTIONARY_SIZES[-1]} skills: {growth:.2f}x")
+    if growth > MAX_GROWTH:
+        print(f"FAIL: matching cost grew more than {MAX_GROWTH}x with dictionary size")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Benchmark: cold import cost of the analysis engine
+Imports the engine module in fresh interpreters with `python -X importtime`
+and fails if the cumulative import time exceeds the budget, or if a heavy
+dependency that should be deferred is loaded at import.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_startup.py [budget_ms]
+The budget can also be set with RESUME_ANALYZER_IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+TARGET_MODULE = 'utils.analysis_engine'
+DEFAULT_BUDGET_MS = 300.0
+RUNS = 5
+
+# Imported only by the stage that needs them, never by the engine module
+DEFERRED_MODULES = ('sklearn', 'scipy', 'nltk', 'pandas', 'plotly')
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Map module name to (self_us, cumulative_us) from -X importtime output"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def cold_import(module: str) -> tuple:
+    """
+    Import a module in a fresh interpreter
+
+    Returns:
+        Tuple of (importtime timings, modules loaded by the import)
+    """
+    code = (
+        f"import sys; before = set(sys.modules); import {module}; "
+        f"print('\\n'.join(sorted(set(sys.modules) - before)))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return parse_importtime(result.stderr), result.stdout.split()
+
+
+def main() -> int:
+    if len(sys.argv) > 1:
+        budget_ms = float(sys.argv[1])
+    else:
+        budget_ms = float(os.environ.get('RESUME_ANALYZER_IMPORT_BUDGET_MS', DEFAULT_BUDGET_MS))
+
+    best_ms = float('inf')
+    best_timings, loaded = {}, []
+    for _ in range(RUNS):
+        timings, loaded = cold_import(TARGET_MODULE)
+        elapsed_ms = timings[TARGET_MODULE][1] / 1000
+        if elapsed_ms < best_ms:
+            best_ms, best_timings = elapsed_ms, timings
+
+    print(f"cold import of {TARGET_MODULE}: {best_ms:.1f} ms (budget {budget_ms:.0f} ms, best of {RUNS})")
+    print("slowest imports (cumulative):")
+    loaded_set = set(loaded)
+    slowest = sorted(
+        (item for item in best_timings.items() if item[0] in loaded_set and item[0] != TARGET_MODULE),
+        key=lambda item: item[1][1], reverse=True
+    )
+    for name, (_, cumulative_us) in slowest[:10]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    ok = True
+    eager = sorted({name.split('.')[0] for name in loaded} & set(DEFERRED_MODULES))
+    if eager:
+        print(f"FAIL: deferred dependencies imported eagerly: {', '.join(eager)}")
+        ok = False
+    if best_ms > budget_ms:
+        print(f"FAIL: cold import exceeds the budget by {best_ms - budget_ms:.1f} ms")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
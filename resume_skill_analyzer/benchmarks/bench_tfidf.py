@@ -0,0 +1,55 @@
+"""
+Benchmark: per-resume TF-IDF skill scoring latency
+Compares refitting the vectorizer per resume against the fit-once skill matrix.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_tfidf.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from nlp_modules.skill_extractor import SkillExtractor
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+JOB_SKILLS_PATH = os.path.join(BASE_DIR, 'data', 'job_skills.json')
+SAMPLE_PATH = os.path.join(BASE_DIR, 'samples', 'sample_resume.txt')
+REPEAT = 50
+
+
+def refit_per_resume(extractor: SkillExtractor, text: str):
+    """Previous behaviour: fit a new vocabulary on the resume plus all skills"""
+    vectorizer = TfidfVectorizer(ngram_range=(1, 3), max_features=1000, stop_words='english')
+    tfidf_matrix = vectorizer.fit_transform([text] + list(extractor.all_skills))
+    return cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:])[0]
+
+
+def time_per_call(func, *args) -> float:
+    """Average wall time of func(*args) in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func(*args)
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main() -> int:
+    extractor = SkillExtractor(JOB_SKILLS_PATH)
+    with open(SAMPLE_PATH, 'r') as f:
+        text = f.read()
+
+    before = time_per_call(refit_per_resume, extractor, text)
+    after = time_per_call(extractor.extract_skills_tfidf, text)
+
+    print(f"refit per resume : {before:8.2f} ms")
+    print(f"fit-once skills  : {after:8.2f} ms")
+    print(f"speedup          : {before / after:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
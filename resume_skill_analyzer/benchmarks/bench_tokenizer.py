@@ -0,0 +1,121 @@
+"""
+Benchmark: regex tokenizer engine versus nltk.word_tokenize
+Checks parity with the NLTK engine on cleaned text, then measures throughput.
+Parity is checked offline against NLTK outputs stored in
+fixtures/nltk_tokens.json; the NLTK throughput is measured only when the
+punkt data is installed. Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_tokenizer.py
+    python benchmarks/bench_tokenizer.py --update-fixtures  # needs punkt
+"""
+
+import difflib
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from nlp_modules.text_processor import TextProcessor
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'samples', 'sample_resume.txt')
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'nltk_tokens.json')
+MIN_AGREEMENT = 0.99
+
+# Cleaned inputs on which both engines must produce the same tokens
+PARITY_CASES = [
+    "python developer with 5 years of experience in django and flask.",
+    "built rest apis with node.js express.js and mongodb",
+    "ci/cd pipelines using jenkins github actions and docker",
+    "languages c++ java python 3.10 and .net core",
+    "skills machine learning deep learning nlp computer vision.",
+    "worked at example inc. on a-b testing and ui/ux design",
+]
+
+# Skill-bearing tokens the regex engine keeps intact (NLTK splits c# into c and #)
+SKILL_TOKEN_CASES = {
+    "c++ and c# developer": ['c++', 'and', 'c#', 'developer'],
+    "node.js react.js vue.js": ['node.js', 'react.js', 'vue.js'],
+    "ci/cd with .net and asp.net.": ['ci/cd', 'with', '.net', 'and', 'asp.net', '.'],
+}
+
+
+def nltk_outputs(nltk_processor: TextProcessor, sample: str) -> dict:
+    """NLTK engine tokens for PARITY_CASES and the preprocessed sample resume"""
+    import nltk
+    return {
+        'nltk_version': nltk.__version__,
+        'parity_cases': {text: nltk_processor.tokenize(text) for text in PARITY_CASES},
+        'sample_resume': nltk_processor.preprocess_text(sample),
+    }
+
+
+def check_parity(regex_processor: TextProcessor, expected: dict, sample: str) -> bool:
+    """Report parity failures against stored NLTK outputs; return True if all checks pass"""
+    ok = True
+    for text in PARITY_CASES:
+        regex_tokens = regex_processor.tokenize(text)
+        nltk_tokens = expected['parity_cases'].get(text)
+        if nltk_tokens is None:
+            print(f"NO FIXTURE {text!r}; run with --update-fixtures")
+            ok = False
+        elif regex_tokens != nltk_tokens:
+            print(f"MISMATCH {text!r}\n  regex: {regex_tokens}\n  nltk : {nltk_tokens}")
+            ok = False
+
+    for text, expected_tokens in SKILL_TOKEN_CASES.items():
+        tokens = regex_processor.tokenize(text)
+        if tokens != expected_tokens:
+            print(f"SKILL TOKEN {text!r}: expected {expected_tokens}, got {tokens}")
+            ok = False
+
+    # Whole-resume agreement after the full preprocessing pipeline
+    regex_tokens = regex_processor.preprocess_text(sample)
+    matcher = difflib.SequenceMatcher(a=expected['sample_resume'], b=regex_tokens, autojunk=False)
+    agreement = matcher.ratio()
+    print(f"sample resume token agreement: {agreement:.4f} (NLTK {expected['nltk_version']} fixtures)")
+    if agreement < MIN_AGREEMENT:
+        ok = False
+    return ok
+
+
+def throughput(processor: TextProcessor, text: str, repeat: int = 5) -> float:
+    """Best-of-N tokenization throughput in MB/s"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        processor.tokenize(text)
+        best = min(best, time.perf_counter() - start)
+    return len(text) / best / 1e6
+
+
+def main() -> int:
+    regex_processor = TextProcessor(tokenizer='regex')
+    nltk_processor = TextProcessor(tokenizer='nltk')
+    with open(SAMPLE_PATH, 'r') as f:
+        sample = f.read()
+
+    if '--update-fixtures' in sys.argv[1:]:
+        with open(FIXTURES_PATH, 'w') as f:
+            json.dump(nltk_outputs(nltk_processor, sample), f, indent=1)
+            f.write('\n')
+        print(f"wrote {FIXTURES_PATH}")
+
+    with open(FIXTURES_PATH, 'r') as f:
+        ok = check_parity(regex_processor, json.load(f), sample)
+
+    text = regex_processor.clean_text(sample * 100)
+    regex_speed = throughput(regex_processor, text)
+    print(f"regex engine: {regex_speed:8.2f} MB/s")
+    try:
+        nltk_speed = throughput(nltk_processor, text)
+    except LookupError as e:
+        print(f"nltk engine : skipped ({e})")
+    else:
+        print(f"nltk engine : {nltk_speed:8.2f} MB/s ({regex_speed / nltk_speed:.0f}x slower)")
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Benchmark: single-read upload buffer
+Checks type sniffing and text decoding on representative uploads, then
+measures how much of the upload each read path reads and allocates.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_upload_buffer.py
+"""
+
+import codecs
+import hashlib
+import io
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bench_pdf_extraction import build_pdf
+from utils.pdf_extractor import PDFExtractor
+from utils.upload_buffer import UploadBuffer
+
+UPLOAD_MB = 8
+
+
+class FakeUpload(io.BytesIO):
+    """Stand-in for Streamlit's UploadedFile (a BytesIO with a MIME type)"""
+
+    def __init__(self, data: bytes, mime_type: str, name: str = 'resume'):
+        super().__init__(data)
+        self.type = mime_type
+        self.name = name
+
+
+class CountingUpload(FakeUpload):
+    """FakeUpload that counts the bytes handed out by read() and getvalue()"""
+
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def getvalue(self):
+        data = super().getvalue()
+        self.bytes_read += len(data)
+        return data
+
+
+RESUME = "José Müller — Senior Engineer, Python & SQL, naïve Bayes, 5 years"
+
+# (description, bytes, declared type, expected sniffed type, expected text)
+CASES = [
+    ("utf-8", RESUME.encode('utf-8'), 'text/plain', 'text/plain', RESUME),
+    ("utf-8 with BOM", codecs.BOM_UTF8 + RESUME.encode('utf-8'), 'text/plain', 'text/plain', RESUME),
+    ("utf-16 with BOM", RESUME.encode('utf-16'), 'text/plain', 'text/plain', RESUME),
+    ("cp1252", RESUME.encode('cp1252'), 'text/plain', 'text/plain', RESUME),
+    ("text declared as csv", b"python,sql", 'text/csv', 'text/plain', "python,sql"),
+    ("text without a declared type", b"python sql", 'application/octet-stream', 'text/plain', "python sql"),
+    ("pdf declared as text", build_pdf(2), 'text/plain', 'application/pdf', None),
+    ("png declared as text", b"\x89PNG\r\n\x1a\n" + bytes(64), 'text/plain', 'image/png', None),
+    ("binary with NUL bytes", b"\x01\x02\x00\x03" * 16, 'text/plain', 'application/octet-stream', None),
+]
+
+# (description, bytes, declared type, file name): uploads claiming to be a PDF
+# whose content is not one must be rejected, not decoded as text
+NOT_PDF_CASES = [
+    ("text named .pdf", b"python sql docker", 'text/plain', 'resume.PDF'),
+    ("text declared as pdf", b"python sql docker", 'application/pdf', 'resume'),
+    ("pdf header after the first KB", b"\n" * 2048 + build_pdf(1), 'application/pdf', 'resume.pdf'),
+]
+
+
+def check_cases() -> bool:
+    """Report mismatches; return True if every case passes"""
+    ok = True
+    for description, data, declared_type, expected_type, expected_text in CASES:
+        result = PDFExtractor.extract_uploaded_file(FakeUpload(data, declared_type))
+        if result.file_type != expected_type:
+            print(f"FAIL {description}: sniffed {result.file_type}, expected {expected_type}")
+            ok = False
+        elif expected_text is not None and result.text != expected_text:
+            print(f"FAIL {description}: decoded {result.text!r} with {result.encoding}")
+            ok = False
+        elif expected_type == 'application/pdf' and not result.ok:
+            print(f"FAIL {description}: {result.error}")
+            ok = False
+        else:
+            print(f"ok   {description:<30} {result.file_type:<26} {result.encoding or ''}")
+
+    for description, data, declared_type, name in NOT_PDF_CASES:
+        result = PDFExtractor.extract_uploaded_file(FakeUpload(data, declared_type, name))
+        if result.ok or result.text:
+            print(f"FAIL {description}: accepted as {result.file_type}")
+            ok = False
+        else:
+            print(f"ok   {description:<30} rejected: {result.error}")
+    return ok
+
+
+def previous_read_path(uploaded_file) -> str:
+    """Previous behaviour: getvalue() for the hash, then read() to decode"""
+    hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+    return uploaded_file.read().decode('utf-8')
+
+
+def buffer_read_path(uploaded_file) -> str:
+    """Current behaviour: one UploadBuffer shared by hashing and decoding"""
+    upload = UploadBuffer.from_upload(uploaded_file)
+    upload.content_hash()
+    return upload.decode_text()[0]
+
+
+def measure(func, data: bytes) -> tuple:
+    """
+    Run func on a fresh upload of data
+
+    Returns:
+        Tuple of (bytes read from the upload, peak bytes allocated beyond
+        the decoded text)
+    """
+    uploaded_file = CountingUpload(data, 'text/plain')
+    tracemalloc.start()
+    text = func(uploaded_file)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return uploaded_file.bytes_read, peak - sys.getsizeof(text)
+
+
+def main() -> int:
+    ok = check_cases()
+
+    # A latin-1 file that is not valid UTF-8: the previous fallback re-read an
+    # exhausted stream and decoded empty bytes
+    legacy = FakeUpload("Résumé".encode('latin-1'), 'text/plain')
+    try:
+        legacy.read().decode('utf-8')
+    except UnicodeDecodeError:
+        print(f"previous fallback decoded: {legacy.read().decode('latin-1')!r}")
+
+    # ASCII payload, so the decoded text takes one byte per character
+    data = b"Python developer, SQL, Docker, Kubernetes, machine learning\n" * (
+        UPLOAD_MB * 1024 * 1024 // 60)
+    size = len(data)
+    for label, func in (("previous read path", previous_read_path),
+                        ("upload buffer", buffer_read_path)):
+        bytes_read, extra = measure(func, data)
+        print(f"{label:<18}: reads {bytes_read / size:3.1f}x the upload, "
+              f"peak {extra / size:3.1f}x the upload beyond the decoded text")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Benchmark: batch throughput from one worker to every core
+Compares workers that each build their own engine with EngineWorkerPool,
+whose forked workers share the engine built once in the parent, and reports
+resumes per second and private memory per worker.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/bench_worker_pool.py [num_resumes]
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils import analysis_engine
+from utils.analysis_engine import get_analysis_engine
+from utils.resume_pipeline import analyze_roles
+from utils.worker_pool import FORK_AVAILABLE, EngineWorkerPool
+
+JOB_SKILLS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'job_skills.json')
+SAMPLE_RESUME_PATH = os.path.join(os.path.dirname(__file__), '..', 'samples', 'sample_resume.txt')
+NUM_RESUMES = 240
+MAX_TASKS_PER_CHILD = 40
+
+
+def _private_kb() -> int:
+    """Private (unshared) memory of this process in KB, 0 where /proc is unavailable"""
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            return sum(int(line.split()[1]) for line in f
+                       if line.startswith(('Private_Clean', 'Private_Dirty')))
+    except OSError:
+        return 0
+
+
+def _build_own_engine():
+    """Previous behaviour: every worker (and every replacement) builds an engine"""
+    analysis_engine._engines.clear()
+    get_analysis_engine(JOB_SKILLS_PATH)
+
+
+def _analyze_text(text: str) -> Tuple[int, int]:
+    """Pool task: score one resume against every role"""
+    engine = get_analysis_engine(JOB_SKILLS_PATH)
+    analyze_roles(engine, engine.skill_extractor.extract_skills_combined(text))
+    return os.getpid(), _private_kb()
+
+
+def _summarize(results: List[Tuple[int, int]], elapsed: float) -> Tuple[float, float]:
+    """Return (resumes per second, mean peak private MB per worker process)"""
+    peak_per_pid: Dict[int, int] = {}
+    for pid, private_kb in results:
+        peak_per_pid[pid] = max(private_kb, peak_per_pid.get(pid, 0))
+    mean_kb = sum(peak_per_pid.values()) / len(peak_per_pid)
+    return len(results) / elapsed, mean_kb / 1024
+
+
+def run_own_engine(texts: List[str], workers: int) -> Tuple[float, float]:
+    start = time.perf_counter()
+    with multiprocessing.get_context('fork').Pool(workers, initializer=_build_own_engine,
+                                                  maxtasksperchild=MAX_TASKS_PER_CHILD) as pool:
+        results = list(pool.imap_unordered(_analyze_text, texts, 4))
+    return _summarize(results, time.perf_counter() - start)
+
+
+def run_shared_engine(texts: List[str], workers: int) -> Tuple[float, float]:
+    start = time.perf_counter()
+    with EngineWorkerPool(JOB_SKILLS_PATH, workers, MAX_TASKS_PER_CHILD) as pool:
+        results = list(pool.imap_unordered(_analyze_text, texts, 4))
+    return _summarize(results, time.perf_counter() - start)
+
+
+def worker_counts() -> List[int]:
+    """1, 2, 4, ... up to and including the CPU count"""
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def main() -> int:
+    if not FORK_AVAILABLE:
+        print("The fork start method is unavailable; workers build their own engine here.")
+        return 0
+
+    num_resumes = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_RESUMES
+    with open(SAMPLE_RESUME_PATH) as f:
+        sample = f.read()
+    # Vary each resume so no layer can reuse a previous result
+    texts = [f"{sample}\nReference number {i}" for i in range(num_resumes)]
+
+    print(f"{num_resumes} resumes, workers recycled every {MAX_TASKS_PER_CHILD} tasks, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'workers':>7} | {'own engine':>22} | {'shared engine':>22}")
+    baseline = None
+    for workers in worker_counts():
+        own_rate, own_mb = run_own_engine(texts, workers)
+        shared_rate, shared_mb = run_shared_engine(texts, workers)
+        baseline = baseline or shared_rate
+        print(f"{workers:>7} | {own_rate:7.1f}/s {own_mb:6.1f} MB priv | "
+              f"{shared_rate:7.1f}/s {shared_mb:6.1f} MB priv  "
+              f"(x{shared_rate / baseline:.2f} vs 1 worker)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
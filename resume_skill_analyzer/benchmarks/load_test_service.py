@@ -0,0 +1,152 @@
+"""
+Load test: local analysis service under concurrent requests
+Starts the service (or targets --url), posts distinct resumes from many
+client threads and reports throughput, latency percentiles, how many
+requests were shed with 503 and how many were coalesced.
+Run from the resume_skill_analyzer directory:
+    python benchmarks/load_test_service.py --requests 200 --concurrency 16
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+SERVICE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+SAMPLE_RESUME_PATH = os.path.join(SERVICE_DIR, 'samples', 'sample_resume.txt')
+STARTUP_TIMEOUT = 60.0
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def post(host: str, port: int, path: str, body: bytes) -> Tuple[int, float]:
+    """Send one request; return (status, latency in seconds), status 0 on connection errors"""
+    start = time.perf_counter()
+    connection = http.client.HTTPConnection(host, port, timeout=300)
+    try:
+        connection.request('POST', path, body, {'Content-Type': 'text/plain'})
+        response = connection.getresponse()
+        response.read()
+        status = response.status
+    except (OSError, http.client.HTTPException):
+        status = 0
+    finally:
+        connection.close()
+    return status, time.perf_counter() - start
+
+
+def wait_until_healthy(host: str, port: int, service: Optional[subprocess.Popen]) -> bool:
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if service is not None and service.poll() is not None:
+            return False
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=1)
+            connection.request('GET', '/health')
+            if connection.getresponse().status == 200:
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def get_health(host: str, port: int) -> dict:
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    try:
+        connection.request('GET', '/health')
+        return json.loads(connection.getresponse().read())
+    except (OSError, ValueError, http.client.HTTPException):
+        return {}
+    finally:
+        connection.close()
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the local analysis service.")
+    parser.add_argument('--url', help="Running service to test (default: start one on a free port)")
+    parser.add_argument('--endpoint', default='/analyze?role=' + quote('Data Scientist'),
+                        help="Path and query to POST to (default: /analyze for one role)")
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--workers', type=int, help="Workers for the started service")
+    parser.add_argument('--max-pending', type=int, help="Queue bound for the started service")
+    parser.add_argument('--identical', action='store_true',
+                        help="Post the same resume every time, as when a shared file is submitted "
+                             "by many sessions")
+    args = parser.parse_args()
+
+    service = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = '127.0.0.1', free_port()
+        command = [sys.executable, 'service.py', '--port', str(port)]
+        if args.workers:
+            command += ['--workers', str(args.workers)]
+        if args.max_pending:
+            command += ['--max-pending', str(args.max_pending)]
+        service = subprocess.Popen(command, cwd=SERVICE_DIR)
+
+    try:
+        if not wait_until_healthy(host, port, service):
+            print("FAIL: the service did not become healthy")
+            return 1
+
+        with open(SAMPLE_RESUME_PATH, 'rb') as f:
+            sample = f.read()
+        if args.identical:
+            bodies = [sample] * args.requests
+        else:
+            # Distinct resumes, so neither the result cache nor request
+            # coalescing answers for the workers
+            bodies = [sample + b"\nReference number %d" % i for i in range(args.requests)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.concurrency) as clients:
+            results = list(clients.map(lambda body: post(host, port, args.endpoint, body), bodies))
+        elapsed = time.perf_counter() - start
+        health = get_health(host, port)
+    finally:
+        if service is not None:
+            service.terminate()
+            service.wait()
+
+    statuses = Counter(status for status, _ in results)
+    latencies = sorted(latency for status, latency in results if status == 200)
+    print(f"{args.requests} requests to {args.endpoint}, {args.concurrency} concurrent clients")
+    print(f"status counts : {dict(sorted(statuses.items()))}")
+    print(f"elapsed       : {elapsed:.2f} s, {statuses[200] / elapsed:.1f} successful requests/s")
+    if latencies:
+        print(f"latency (200) : p50 {percentile(latencies, 0.50) * 1000:.0f} ms, "
+              f"p95 {percentile(latencies, 0.95) * 1000:.0f} ms, "
+              f"p99 {percentile(latencies, 0.99) * 1000:.0f} ms")
+    if 'service_requests' in health.get('single_flight', {}):
+        print(f"coalesced     : {health['single_flight']['service_requests']['saved']} "
+              f"requests shared an in-flight task")
+
+    unexpected = set(statuses) - {200, 503}
+    if unexpected:
+        print(f"FAIL: unexpected statuses {sorted(unexpected)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,13 @@ Uses keyword-based extraction and TF-IDF for skill identification
 """
 
 import json
-import re
-from typing import List, Dict, Set, Tuple
-from collections import Counter
+from typing import List, Dict, Set, Tuple, Iterable, Iterator, Union
+from itertools import islice
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from .text_processor import TextProcessor
+from .skill_matcher import SkillMatcher
+from .skill_registry import SkillRegistry, SkillSet
 
 class SkillExtractor:
     """Advanced skill extraction using NLP techniques"""
@@ -23,9 +22,20 @@ class SkillExtractor:
         Args:
             job_skills_path: Path to job_skills.json file
         """
-        self.text_processor = TextProcessor()
+        # Imported here so that importing this module stays cheap
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
         self.job_skills_data = self._load_job_skills(job_skills_path)
+        self.text_processor = TextProcessor(self.job_skills_data.get('term_normalizations'))
         self.all_skills = self._extract_all_skills()
+        self.skill_registry = SkillRegistry(self.job_skills_data)
+        
+        # Compile all skill variations into one multi-pattern matcher that
+        # counts by registry ID
+        self.skill_matcher = SkillMatcher({
+            skill_id: self._get_skill_variations(skill.lower())
+            for skill_id, skill in enumerate(self.skill_registry.skill_names)
+        })
         
         # Initialize TF-IDF vectorizer
         self.tfidf_vectorizer = TfidfVectorizer(
@@ -34,6 +44,11 @@ class SkillExtractor:
             stop_words='english'
         )
         
+        # Fit the skill vocabulary once; rows are L2-normalized skill vectors
+        # and row i belongs to skill ID i in the registry
+        self.skill_names = self.skill_registry.skill_names
+        self.skill_tfidf_matrix = self.tfidf_vectorizer.fit_transform(self.skill_names)
+        
     def _load_job_skills(self, path: str) -> Dict:
         """Load job skills database"""
         with open(path, 'r') as f:
@@ -63,38 +78,21 @@ class SkillExtractor:
         Returns:
             Dictionary of skills and their frequencies
         """
-        # Normalize text
-        normalized_text = self.text_processor.normalize_skill_terms(text.lower())
+        return {
+            self.skill_names[skill_id]: count
+            for skill_id, count in self._count_keyword_skills(text).items()
+        }
+    
+    def _count_keyword_skills(self, text: str) -> Dict[int, int]:
+        """Keyword frequencies of the skills found in text, by skill ID"""
+        # Normalize text (also lowercases it)
+        normalized_text = self.text_processor.normalize_skill_terms(text)
         
         # Preprocess text
-        tokens = self.text_processor.preprocess_text(normalized_text)
-        
-        # Create n-grams for multi-word skills
-        bigrams = self.text_processor.extract_ngrams(tokens, 2)
-        trigrams = self.text_processor.extract_ngrams(tokens, 3)
-        
-        # Combine all potential skill terms
-        all_terms = tokens + bigrams + trigrams
+        tokens = self.text_processor.preprocess_text(normalized_text, lowercase=False)
         
-        # Count skill occurrences
-        skill_counts = {}
-        
-        for skill in self.all_skills:
-            skill_lower = skill.lower()
-            skill_variations = self._get_skill_variations(skill_lower)
-            
-            count = 0
-            for variation in skill_variations:
-                # Count exact matches
-                count += sum(1 for term in all_terms if variation in term)
-                
-                # Count in original text (for cases where tokenization might miss)
-                count += len(re.findall(r'\b' + re.escape(variation) + r'\b', normalized_text))
-            
-            if count > 0:
-                skill_counts[skill] = count
-        
-        return skill_counts
+        # Count every skill variation in tokens, n-grams and text in one pass
+        return self.skill_matcher.count_skills(normalized_text, tokens)
     
     def _get_skill_variations(self, skill: str) -> List[str]:
         """Get variations of a skill term for better matching"""
@@ -120,41 +118,49 @@ class SkillExtractor:
         
         return variations
     
-    def extract_skills_tfidf(self, text: str, top_k: int = 50) -> List[Tuple[str, float]]:
+    def extract_skills_tfidf(self, text: str, top_k: int = 50,
+                             min_score: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
         """
         Extract skills using TF-IDF similarity
         
         Args:
             text: Resume text
             top_k: Number of top skills to return
+            min_score: Only skills scoring strictly above this are returned
             
         Returns:
-            List of (skill, score) tuples
+            Tuple of (skill_ids, scores) arrays sorted by descending score;
+            skill_ids index into self.skill_names
         """
-        # Prepare documents
-        documents = [text] + list(self.all_skills)
-        
-        # Fit TF-IDF
         try:
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(documents)
+            # Project the resume onto the pre-fitted skill vocabulary
+            resume_vector = self.tfidf_vectorizer.transform([text])
             
-            # Calculate similarity between resume and each skill
-            resume_vector = tfidf_matrix[0:1]
-            skill_vectors = tfidf_matrix[1:]
+            # Cosine similarity with every skill (both sides are L2-normalized)
+            similarities = (resume_vector @ self.skill_tfidf_matrix.T).tocsr()
             
-            similarities = cosine_similarity(resume_vector, skill_vectors)[0]
-            
-            # Get top skills
-            skill_scores = list(zip(self.all_skills, similarities))
-            skill_scores.sort(key=lambda x: x[1], reverse=True)
-            
-            return skill_scores[:top_k]
+            return self._select_top_skills(similarities.indices, similarities.data, top_k, min_score)
             
         except Exception as e:
             print(f"TF-IDF extraction failed: {e}")
-            return []
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
     
-    def extract_skills_combined(self, text: str, min_frequency: int = 1) -> Dict[str, float]:
+    @staticmethod
+    def _select_top_skills(skill_ids: np.ndarray, scores: np.ndarray, top_k: int,
+                           min_score: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Keep the top_k scores above min_score from a sparse similarity row"""
+        keep = scores > min_score
+        skill_ids, scores = skill_ids[keep], scores[keep]
+        
+        # Partial selection first, then sort only the k survivors
+        if len(scores) > top_k:
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+            skill_ids, scores = skill_ids[top], scores[top]
+        
+        order = np.argsort(-scores, kind='stable')
+        return skill_ids[order].astype(np.intp), scores[order]
+    
+    def extract_skill_set(self, text: str, min_frequency: int = 1) -> SkillSet:
         """
         Combine keyword and TF-IDF methods for robust skill extraction
         
@@ -163,32 +169,89 @@ class SkillExtractor:
             min_frequency: Minimum frequency for keyword-based extraction
             
         Returns:
-            Dictionary of skills and combined scores
+            SkillSet of the found skills and their combined scores
         """
         # Keyword-based extraction
-        keyword_skills = self.extract_skills_keyword_based(text)
+        keyword_counts = self._count_keyword_skills(text)
         
         # TF-IDF extraction
-        tfidf_skills = self.extract_skills_tfidf(text)
+        tfidf_ids, tfidf_scores = self.extract_skills_tfidf(text)
+        
+        return self._combine_scores(keyword_counts, tfidf_ids, tfidf_scores, min_frequency)
+    
+    def extract_skills_combined(self, text: str, min_frequency: int = 1) -> Dict[str, float]:
+        """
+        Combined skill extraction with skill names, for display and caching
         
-        # Combine results
-        combined_skills = {}
+        Args:
+            text: Resume text
+            min_frequency: Minimum frequency for keyword-based extraction
+            
+        Returns:
+            Dictionary of skills and combined scores, highest score first
+        """
+        return self.extract_skill_set(text, min_frequency).to_dict()
+    
+    def extract_many(self, texts: Iterable[str], min_frequency: int = 1,
+                     chunk_size: int = 256, top_k: int = 50) -> Iterator[Dict[str, float]]:
+        """
+        Combined skill extraction for a stream of resumes
+        
+        Each chunk of resumes is vectorized into one sparse document-term
+        matrix and scored against every skill with a single sparse product.
+        Results are identical to calling extract_skills_combined per text.
+        
+        Args:
+            texts: Iterable of resume texts
+            min_frequency: Minimum frequency for keyword-based extraction
+            chunk_size: Number of resumes vectorized together
+            top_k: Number of top TF-IDF skills kept per resume
+            
+        Returns:
+            Iterator of skill score dictionaries, in input order
+        """
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, chunk_size))
+            if not chunk:
+                return
+            
+            # One document-term matrix and one product for the whole chunk
+            document_matrix = self.tfidf_vectorizer.transform(chunk)
+            similarities = (document_matrix @ self.skill_tfidf_matrix.T).tocsr()
+            
+            for row, text in enumerate(chunk):
+                start, end = similarities.indptr[row], similarities.indptr[row + 1]
+                tfidf_ids, tfidf_scores = self._select_top_skills(
+                    similarities.indices[start:end], similarities.data[start:end], top_k, 0.0
+                )
+                keyword_counts = self._count_keyword_skills(text)
+                yield self._combine_scores(keyword_counts, tfidf_ids, tfidf_scores, min_frequency).to_dict()
+    
+    def _combine_scores(self, keyword_counts: Dict[int, int], tfidf_ids: np.ndarray,
+                        tfidf_scores: np.ndarray, min_frequency: int) -> SkillSet:
+        """Merge keyword frequencies and TF-IDF similarities into one score per skill ID"""
+        found = self.skill_registry.empty_mask()
+        scores = np.zeros(len(found))
         
         # Add keyword-based skills with frequency weighting
-        max_freq = max(keyword_skills.values()) if keyword_skills else 1
-        for skill, freq in keyword_skills.items():
-            if freq >= min_frequency:
-                combined_skills[skill] = freq / max_freq
-        
-        # Add TF-IDF skills with similarity weighting
-        for skill, score in tfidf_skills:
-            if skill not in combined_skills:
-                combined_skills[skill] = score * 0.5  # Lower weight for TF-IDF only
-            else:
-                # Boost existing skills with TF-IDF score
-                combined_skills[skill] = min(1.0, combined_skills[skill] + score * 0.3)
-        
-        return combined_skills
+        if keyword_counts:
+            keyword_ids = np.fromiter(keyword_counts.keys(), dtype=np.intp, count=len(keyword_counts))
+            frequencies = np.fromiter(keyword_counts.values(), dtype=np.float64, count=len(keyword_counts))
+            keep = frequencies >= min_frequency
+            scores[keyword_ids[keep]] = frequencies[keep] / frequencies.max()
+            found[keyword_ids[keep]] = True
+        
+        # Add TF-IDF skills with similarity weighting: boost skills already
+        # found, add the others at a lower weight
+        scores[tfidf_ids] = np.where(
+            found[tfidf_ids],
+            np.minimum(1.0, scores[tfidf_ids] + tfidf_scores * 0.3),
+            tfidf_scores * 0.5
+        )
+        found[tfidf_ids] = True
+        
+        return SkillSet(self.skill_registry, found, scores)
     
     def get_job_role_skills(self, job_role: str) -> List[str]:
         """Get required skills for a specific job role"""
@@ -206,22 +269,29 @@ class SkillExtractor:
         """Get list of all available job roles"""
         return list(self.job_skills_data['job_roles'].keys())
     
-    def categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
+    def categorize_skills(self, skills: Union[SkillSet, List[str]]) -> Dict[str, List[str]]:
         """
         Categorize skills into technical categories
         
         Args:
-            skills: List of skills to categorize
+            skills: SkillSet or list of skill names to categorize
             
         Returns:
             Dictionary of categories and their skills
         """
         categorized = {}
+        if isinstance(skills, SkillSet):
+            skill_ids = skills.ids()
+            labels = [self.skill_names[skill_id] for skill_id in skill_ids.tolist()]
+        else:
+            skill_ids = self.skill_registry.ids_of(skills)
+            labels = skills
+        known = skill_ids >= 0
         
-        for category, category_skills in self.job_skills_data['technical_skills_database'].items():
+        for category, category_mask in self.skill_registry.category_masks.items():
             category_name = category.replace('_', ' ').title()
-            matched_skills = [skill for skill in skills if skill in category_skills]
-            if matched_skills:
-                categorized[category_name] = matched_skills
+            in_category = known & category_mask[skill_ids]
+            if in_category.any():
+                categorized[category_name] = [label for label, hit in zip(labels, in_category) if hit]
         
         return categorized
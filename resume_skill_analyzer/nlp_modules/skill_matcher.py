@@ -0,0 +1,203 @@
+"""
+Multi-Pattern Skill Matching Module
+Aho-Corasick automaton for finding every skill variation in a single pass
+"""
+
+from bisect import bisect_left
+from collections import deque
+from itertools import accumulate
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    """Mirror the definition of \\w used by the re module for str patterns"""
+    return ch.isalnum() or ch == '_'
+
+
+class AhoCorasickAutomaton:
+    """Compiled multi-pattern matcher over a fixed set of literal strings"""
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Build the automaton for a set of patterns
+
+        Args:
+            patterns: Literal strings to search for (duplicates are ignored)
+        """
+        self.patterns = [p for p in dict.fromkeys(patterns) if p]
+        self.pattern_lengths = [len(p) for p in self.patterns]
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        # Build the trie
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (pattern_id,)
+
+        # Breadth-first pass to compute failure links and merge outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Find every (possibly overlapping) pattern occurrence in text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Iterator of (start_index, pattern_id) in order of end position
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self.pattern_lengths
+
+        state = 0
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in out[state]:
+                yield index - lengths[pattern_id] + 1, pattern_id
+
+
+class SkillMatcher:
+    """Counts skill occurrences with one automaton built per skill database"""
+
+    def __init__(self, skill_variations: Dict[Hashable, List[str]]):
+        """
+        Compile skill variations into a single automaton
+
+        Args:
+            skill_variations: Mapping of skill key (a name or registry ID) to
+                its lowercase variations
+        """
+        self.skill_variations = skill_variations
+        self.automaton = AhoCorasickAutomaton(
+            variation
+            for variations in skill_variations.values()
+            for variation in variations
+        )
+        pattern_ids = {pattern: i for i, pattern in enumerate(self.automaton.patterns)}
+
+        # Reverse index so that only matched patterns are visited per resume;
+        # a variation listed twice for a skill is counted twice
+        self.pattern_skills: List[List[Hashable]] = [[] for _ in self.automaton.patterns]
+        for skill, variations in skill_variations.items():
+            for variation in variations:
+                if variation in pattern_ids:
+                    self.pattern_skills[pattern_ids[variation]].append(skill)
+
+    def count_word_boundary_matches(self, text: str) -> Dict[int, int]:
+        """
+        Count non-overlapping \\b-delimited occurrences of every pattern
+
+        Equivalent to len(re.findall(r'\\b' + re.escape(p) + r'\\b', text))
+        for each pattern p, computed in one pass.
+
+        Args:
+            text: Normalized resume text
+
+        Returns:
+            Occurrence count per matched pattern id
+        """
+        counts: Dict[int, int] = {}
+        last_end: Dict[int, int] = {}
+        lengths = self.automaton.pattern_lengths
+        text_length = len(text)
+
+        for start, pattern_id in self.automaton.iter_matches(text):
+            if start < last_end.get(pattern_id, 0):
+                continue
+            end = start + lengths[pattern_id]
+            left = _is_word_char(text[start - 1]) if start > 0 else False
+            right = _is_word_char(text[end]) if end < text_length else False
+            if left == _is_word_char(text[start]) or right == _is_word_char(text[end - 1]):
+                continue
+            counts[pattern_id] = counts.get(pattern_id, 0) + 1
+            last_end[pattern_id] = end
+
+        return counts
+
+    def count_term_matches(self, tokens: List[str], max_n: int = 3) -> Dict[int, int]:
+        """
+        Count the n-gram terms (n = 1..max_n) that contain each pattern
+
+        Equivalent to sum(1 for term in all_terms if p in term) where all_terms
+        are the space-joined n-grams of tokens, without building the n-grams.
+
+        Args:
+            tokens: Preprocessed tokens
+            max_n: Largest n-gram size
+
+        Returns:
+            Number of containing terms per matched pattern id
+        """
+        counts: Dict[int, int] = {}
+        if not tokens:
+            return counts
+
+        # Join tokens once; the n-gram at token i is a slice of the joined
+        # text, and a match is mapped to tokens by bisecting the token end
+        # offsets (a separator space belongs to the token before it)
+        joined = ' '.join(tokens)
+        token_ends = [end - 1 for end in accumulate(len(token) + 1 for token in tokens)]
+        num_tokens = len(tokens)
+        lengths = self.automaton.pattern_lengths
+        covered: Dict[Tuple[int, int], int] = {}
+
+        for start, pattern_id in self.automaton.iter_matches(joined):
+            first_token = bisect_left(token_ends, start)
+            last_token = bisect_left(token_ends, start + lengths[pattern_id] - 1, first_token)
+            for n in range(1, max_n + 1):
+                # Windows of size n that contain tokens first..last
+                low = max(0, last_token - n + 1)
+                high = min(first_token, num_tokens - n)
+                low = max(low, covered.get((n, pattern_id), -1) + 1)
+                if low <= high:
+                    counts[pattern_id] = counts.get(pattern_id, 0) + high - low + 1
+                    covered[n, pattern_id] = high
+
+        return counts
+
+    def count_skills(self, normalized_text: str, tokens: List[str]) -> Dict[Hashable, int]:
+        """
+        Count occurrences of every skill
+
+        Args:
+            normalized_text: Lowercased, normalized resume text
+            tokens: Preprocessed tokens of normalized_text
+
+        Returns:
+            Dictionary of skill keys and their frequencies (only non-zero entries)
+        """
+        term_counts = self.count_term_matches(tokens)
+        boundary_counts = self.count_word_boundary_matches(normalized_text)
+
+        skill_counts: Dict[Hashable, int] = {}
+        for counts in (term_counts, boundary_counts):
+            for pattern_id, count in counts.items():
+                for skill in self.pattern_skills[pattern_id]:
+                    skill_counts[skill] = skill_counts.get(skill, 0) + count
+
+        return skill_counts
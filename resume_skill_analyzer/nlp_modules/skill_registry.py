@@ -0,0 +1,205 @@
+"""
+Skill Registry Module
+Interns every skill in the job skills database as a dense integer ID
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import numpy as np
+
+
+class SkillSet:
+    """
+    The skills of one resume as a boolean mask and a score array, both
+    indexed by skill ID in one SkillRegistry
+
+    Built once per resume (see SkillRegistry.skill_set) and passed to the
+    analyzer for every role; skill names are looked up only to display it.
+    """
+
+    def __init__(self, registry: 'SkillRegistry', mask: np.ndarray, scores: np.ndarray):
+        """
+        Args:
+            registry: Registry whose IDs index mask and scores
+            mask: Boolean array, True for skills found in the resume
+            scores: Score of every found skill (0.0 elsewhere)
+        """
+        self.registry = registry
+        self.mask = mask
+        self.scores = scores
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.mask))
+
+    def ids(self) -> np.ndarray:
+        """Return the IDs of the found skills in ascending order"""
+        return np.flatnonzero(self.mask)
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        """Yield (skill name, score) pairs in ID order"""
+        skill_ids = self.ids()
+        names = self.registry.skill_names
+        for skill_id, score in zip(skill_ids.tolist(), self.scores[skill_ids].tolist()):
+            yield names[skill_id], score
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the skills and scores for display, highest score first"""
+        skill_ids = self.ids()
+        scores = self.scores[skill_ids]
+        order = np.argsort(-scores, kind='stable')
+        names = self.registry.skill_names
+        return {names[skill_id]: score for skill_id, score in zip(skill_ids[order].tolist(), scores[order].tolist())}
+
+
+class SkillRegistry:
+    """Maps canonical (case-folded) skills to dense integer IDs and boolean masks"""
+
+    def __init__(self, job_skills_data: Dict):
+        """
+        Build the registry from the job skills database
+
+        Args:
+            job_skills_data: Parsed job_skills.json
+        """
+        all_skills = set()
+        for skills in job_skills_data['technical_skills_database'].values():
+            all_skills.update(skills)
+        for role_data in job_skills_data['job_roles'].values():
+            all_skills.update(role_data['required_skills'])
+
+        # IDs follow the sorted skill names; the first spelling of a skill wins
+        self._ids: Dict[str, int] = {}
+        self.skill_names: List[str] = []
+        for skill in sorted(all_skills):
+            if skill.lower() not in self._ids:
+                self._ids[skill.lower()] = len(self.skill_names)
+                self.skill_names.append(skill)
+
+        # Required skill IDs of every role, in the role's order (a skill
+        # listed twice appears twice)
+        self.role_skill_ids: Dict[str, np.ndarray] = {}
+        self._roles_by_skills: Dict[Tuple[str, ...], str] = {}
+        for role, role_data in job_skills_data['job_roles'].items():
+            self.role_skill_ids[role] = self.ids_of(role_data['required_skills'])
+            self._roles_by_skills.setdefault(tuple(role_data['required_skills']), role)
+
+        self.category_skills: Dict[str, List[str]] = job_skills_data['technical_skills_database']
+        self.category_masks = {
+            category: self.to_mask(skills)
+            for category, skills in self.category_skills.items()
+        }
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[str]) -> 'SkillRegistry':
+        """
+        Build a registry of just these skills, with no categories
+
+        The skills form one unnamed role, so required_ids(skills) uses
+        precomputed IDs.
+        """
+        return cls({'technical_skills_database': {}, 'job_roles': {'': {'required_skills': list(skills)}}})
+
+    def __len__(self) -> int:
+        return len(self.skill_names)
+
+    def role_of(self, required_skills: List[str]) -> Optional[str]:
+        """Return the role with exactly this required skill list, or None"""
+        return self._roles_by_skills.get(tuple(required_skills))
+
+    def required_ids(self, required_skills: List[str]) -> np.ndarray:
+        """
+        Return the IDs of a required skill list
+
+        Lists of database roles use their precomputed IDs; other lists are
+        looked up, with -1 for skills outside the registry.
+        """
+        role = self.role_of(required_skills)
+        if role is not None:
+            return self.role_skill_ids[role]
+        return self.ids_of(required_skills)
+
+    def category_mask(self, category: str, skills: List[str]) -> np.ndarray:
+        """Return the precomputed mask of a database category, or build one for other lists"""
+        if self.category_skills.get(category) == skills:
+            return self.category_masks[category]
+        return self.to_mask(skills)
+
+    def get_id(self, skill: str) -> Optional[int]:
+        """Return the ID of a skill (case-insensitive), or None if unknown"""
+        return self._ids.get(skill.lower())
+
+    def ids_of(self, skills: Iterable[str]) -> np.ndarray:
+        """
+        Look up the IDs of several skills
+
+        Args:
+            skills: Skill names
+
+        Returns:
+            Integer array of IDs in input order, -1 for unknown skills
+        """
+        return np.fromiter((self._ids.get(skill.lower(), -1) for skill in skills), dtype=np.intp)
+
+    def empty_mask(self) -> np.ndarray:
+        """Return an all-False skill set"""
+        return np.zeros(len(self.skill_names), dtype=bool)
+
+    def to_mask(self, skills: Iterable[str]) -> np.ndarray:
+        """
+        Convert skill names to a boolean skill set
+
+        Args:
+            skills: Skill names (unknown skills are ignored)
+
+        Returns:
+            Boolean array indexed by skill ID
+        """
+        ids = self.ids_of(skills)
+        mask = self.empty_mask()
+        mask[ids[ids >= 0]] = True
+        return mask
+
+    def from_ids(self, skill_ids: np.ndarray, scores: np.ndarray) -> SkillSet:
+        """
+        Build a resume skill set from IDs and their scores
+
+        Args:
+            skill_ids: Skill IDs; for a repeated ID the first score wins
+            scores: Score of each entry of skill_ids
+
+        Returns:
+            SkillSet over this registry
+        """
+        unique_ids, first = np.unique(skill_ids, return_index=True)
+        mask = self.empty_mask()
+        mask[unique_ids] = True
+        skill_scores = np.zeros(len(mask))
+        skill_scores[unique_ids] = scores[first]
+        return SkillSet(self, mask, skill_scores)
+
+    def skill_set(self, resume_skills: Union[SkillSet, Dict[str, float], Iterable[str]]) -> SkillSet:
+        """
+        Convert resume skills to a SkillSet over this registry
+
+        Names are case-folded here, once per resume; skills outside the
+        registry are dropped. A SkillSet of this registry is returned as is.
+
+        Args:
+            resume_skills: SkillSet, skill score dict or skill names (scored 1.0)
+
+        Returns:
+            SkillSet over this registry
+        """
+        if isinstance(resume_skills, SkillSet):
+            if resume_skills.registry is self:
+                return resume_skills
+            resume_skills = dict(resume_skills.items())
+        if isinstance(resume_skills, dict):
+            names = list(resume_skills.keys())
+            scores = np.fromiter(resume_skills.values(), dtype=np.float64, count=len(names))
+        else:
+            names = list(resume_skills)
+            scores = np.ones(len(names))
+
+        skill_ids = self.ids_of(names)
+        known = skill_ids >= 0
+        return self.from_ids(skill_ids[known], scores[known])
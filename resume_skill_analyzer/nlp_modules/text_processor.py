@@ -3,29 +3,225 @@ Text Processing Module for Resume Skill Extraction
 Handles tokenization, stopword removal, and text preprocessing
 """
 
+import functools
+import os
 import re
 import string
-from typing import List, Set
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-
-# Download required NLTK data (only once)
-# punkt_tab is required by newer NLTK versions for word_tokenize/sent_tokenize
-for resource in ('punkt', 'punkt_tab', 'stopwords'):
-    try:
-        if resource == 'stopwords':
-            nltk.data.find('corpora/stopwords')
-        else:
-            nltk.data.find(f'tokenizers/{resource}')
-    except LookupError:
-        nltk.download(resource, quiet=True)
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Union
+
+# Vendored resources, so that importing and constructing a TextProcessor
+# never touches the network or the NLTK data path
+RESOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
+ENGLISH_STOPWORDS_PATH = os.path.join(RESOURCE_DIR, 'english_stopwords.txt')
+
+# Common skill term variations
+DEFAULT_NORMALIZATIONS = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'ml': 'machine learning',
+    'dl': 'deep learning',
+    'nlp': 'natural language processing',
+    'cv': 'computer vision',
+    'ai': 'artificial intelligence',
+    'ci/cd': 'ci/cd',
+    'devops': 'devops',
+    'ui/ux': 'ui ux',
+    'fullstack': 'full stack',
+    'full-stack': 'full stack',
+    'back end': 'backend',
+    'back-end': 'backend',
+    'front end': 'frontend',
+    'front-end': 'frontend',
+}
+
+
+def compile_normalizations(normalizations: Dict[str, str]) -> 're.Pattern':
+    """
+    Compile a normalization table into one word-bounded alternation
+    
+    Args:
+        normalizations: Mapping of lowercase term to its replacement
+        
+    Returns:
+        Compiled pattern matching any term of the table
+    """
+    # Longest terms first so overlapping entries prefer the longer match
+    terms = sorted(normalizations, key=len, reverse=True)
+    return re.compile(r'\b(?:' + '|'.join(re.escape(term) for term in terms) + r')\b')
+
+
+_DEFAULT_NORMALIZATION_PATTERN = compile_normalizations(DEFAULT_NORMALIZATIONS)
+
+
+# Runs of non-space characters ending in a non-period, or runs of periods.
+# Keeps c++, c#, node.js, .net and ci/cd whole and splits a trailing
+# sentence period off its word, as word_tokenize does.
+_TOKEN_PATTERN = re.compile(r'\S*[^\s.]|\.+')
+
+
+def regex_tokenize(text: str) -> List[str]:
+    """
+    Fast tokenizer for cleaned text based on one compiled regex
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        List of tokens
+    """
+    return _TOKEN_PATTERN.findall(text)
+
+
+@functools.lru_cache(maxsize=None)
+def load_english_stopwords() -> FrozenSet[str]:
+    """
+    Load the vendored English stopword list (read once per process)
+    
+    Returns:
+        Frozen set of lowercase stopwords
+    """
+    with open(ENGLISH_STOPWORDS_PATH, 'r', encoding='utf-8') as f:
+        return frozenset(
+            line.strip() for line in f
+            if line.strip() and not line.startswith('#')
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _require_punkt() -> None:
+    """
+    Check that NLTK's punkt tokenizer data is installed locally
+    
+    Never downloads: air-gapped hosts must install the data ahead of time.
+    
+    Raises:
+        LookupError: If neither punkt_tab (nltk >= 3.8.2) nor punkt is found
+    """
+    import nltk
+    
+    for resource in ('tokenizers/punkt_tab', 'tokenizers/punkt'):
+        try:
+            nltk.data.find(resource)
+            return
+        except LookupError:
+            continue
+    raise LookupError(
+        "NLTK punkt data is not installed. Install it ahead of time with "
+        "'python -m nltk.downloader punkt_tab' or use the 'regex' engine."
+    )
+
+
+def nltk_word_tokenize(text: str) -> List[str]:
+    """nltk.word_tokenize, imported on first use"""
+    _require_punkt()
+    from nltk.tokenize import word_tokenize
+    return word_tokenize(text)
+
+
+def nltk_sent_tokenize(text: str) -> List[str]:
+    """nltk.sent_tokenize, imported on first use"""
+    _require_punkt()
+    from nltk.tokenize import sent_tokenize
+    return sent_tokenize(text)
+
+
+# Whitespace after sentence-ending punctuation that precedes a capital or digit
+_SENTENCE_BREAK_PATTERN = re.compile(r'(?<=[.!?])\s+(?=["\'(\[]?[A-Z0-9])')
+
+
+def regex_sent_tokenize(text: str) -> List[str]:
+    """
+    Split text into sentences with one compiled regex
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        List of sentences
+    """
+    return _SENTENCE_BREAK_PATTERN.split(text)
+
+
+# Available engines for TextProcessor(tokenizer=..., sentence_splitter=...)
+TOKENIZERS: Dict[str, Callable[[str], List[str]]] = {
+    'regex': regex_tokenize,
+    'nltk': nltk_word_tokenize,
+}
+
+SENTENCE_SPLITTERS: Dict[str, Callable[[str], List[str]]] = {
+    'regex': regex_sent_tokenize,
+    'nltk': nltk_sent_tokenize,
+}
+
+
+def _resolve_engine(engine: Union[str, Callable[[str], List[str]]],
+                    engines: Dict[str, Callable[[str], List[str]]],
+                    kind: str) -> Callable[[str], List[str]]:
+    """Return a callable engine, looking names up in the given registry"""
+    if callable(engine):
+        return engine
+    if engine in engines:
+        return engines[engine]
+    raise ValueError(
+        f"Unknown {kind} '{engine}'. Choose one of: {', '.join(engines)}"
+    )
+
+
+class _CleanTable(dict):
+    """
+    str.translate table that keeps word characters and -.+#/ and maps
+    everything else (including all whitespace) to a space
+    
+    Unicode is too large to enumerate, so entries are computed on first
+    sight of a code point and cached.
+    """
+    
+    def __missing__(self, codepoint: int):
+        ch = chr(codepoint)
+        value = codepoint if ch.isalnum() or ch in '_-.+#/' else ' '
+        self[codepoint] = value
+        return value
+
+
+_CLEAN_TABLE = _CleanTable()
+for _codepoint in range(128):
+    _CLEAN_TABLE[_codepoint]
+
 
 class TextProcessor:
     """Advanced text processing for resume analysis"""
     
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, normalizations: Optional[Dict[str, str]] = None,
+                 tokenizer: Union[str, Callable[[str], List[str]]] = 'regex',
+                 sentence_splitter: Union[str, Callable[[str], List[str]]] = 'regex'):
+        """
+        Initialize the text processor
+        
+        Args:
+            normalizations: Extra term normalizations (e.g. the skill
+                database's 'term_normalizations'); they extend and override
+                DEFAULT_NORMALIZATIONS, and terms and replacements are
+                lowercased to match the lowercase skill patterns
+            tokenizer: Name of an engine in TOKENIZERS ('regex' or 'nltk')
+                or a callable mapping text to a list of tokens
+            sentence_splitter: Name of an engine in SENTENCE_SPLITTERS
+                ('regex' or 'nltk') or a callable mapping text to sentences
+        """
+        self._tokenizer = _resolve_engine(tokenizer, TOKENIZERS, 'tokenizer')
+        self._sentence_splitter = _resolve_engine(
+            sentence_splitter, SENTENCE_SPLITTERS, 'sentence splitter'
+        )
+        
+        if normalizations:
+            self.normalizations = dict(DEFAULT_NORMALIZATIONS)
+            self.normalizations.update({k.lower(): v.lower() for k, v in normalizations.items()})
+            self._normalization_pattern = compile_normalizations(self.normalizations)
+        else:
+            self.normalizations = DEFAULT_NORMALIZATIONS
+            self._normalization_pattern = _DEFAULT_NORMALIZATION_PATTERN
+        
+        self.stop_words = set(load_english_stopwords())
         # Add custom stopwords relevant to resumes
         custom_stopwords = {
             'experience', 'work', 'project', 'projects', 'team', 'teams',
@@ -39,24 +235,26 @@ class TextProcessor:
         }
         self.stop_words.update(custom_stopwords)
         
-    def clean_text(self, text: str) -> str:
+    def clean_text(self, text: str, lowercase: bool = True) -> str:
         """
         Clean and normalize text
         
         Args:
             text: Raw text input
+            lowercase: Set to False when the text is already lowercased
             
         Returns:
             Cleaned text
         """
-        # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\-\.\+\#\/]', ' ', text)
+        # Replace special characters and whitespace with spaces in one pass
+        text = text.translate(_CLEAN_TABLE)
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Collapse runs of spaces and strip the ends
+        text = ' '.join(text.split())
         
         # Convert to lowercase
-        text = text.lower().strip()
+        if lowercase:
+            text = text.lower()
         
         return text
     
@@ -70,19 +268,26 @@ class TextProcessor:
         Returns:
             List of tokens
         """
-        tokens = word_tokenize(text)
+        tokens = self._tokenizer(text)
         return tokens
     
-    def remove_stopwords(self, tokens: List[str]) -> List[str]:
+    def remove_stopwords(self, tokens: List[str], lowercase: bool = True) -> List[str]:
         """
         Remove stopwords from tokens
         
         Args:
             tokens: List of tokens
+            lowercase: Set to False when the tokens are already lowercased
             
         Returns:
             Filtered tokens
         """
+        if not lowercase:
+            return [
+                token for token in tokens
+                if token not in self.stop_words and len(token) > 1
+            ]
+        
         filtered_tokens = [
             token for token in tokens 
             if token.lower() not in self.stop_words 
@@ -100,27 +305,29 @@ class TextProcessor:
         Returns:
             List of sentences
         """
-        sentences = sent_tokenize(text)
+        sentences = self._sentence_splitter(text)
         return [sent.strip() for sent in sentences if sent.strip()]
     
-    def preprocess_text(self, text: str) -> List[str]:
+    def preprocess_text(self, text: str, lowercase: bool = True) -> List[str]:
         """
         Complete text preprocessing pipeline
         
         Args:
             text: Raw text input
+            lowercase: Set to False when the text is already lowercased
+                (e.g. the output of normalize_skill_terms)
             
         Returns:
             Processed tokens
         """
         # Clean text
-        cleaned_text = self.clean_text(text)
+        cleaned_text = self.clean_text(text, lowercase)
         
         # Tokenize
         tokens = self.tokenize(cleaned_text)
         
-        # Remove stopwords
-        filtered_tokens = self.remove_stopwords(tokens)
+        # Remove stopwords (tokens of cleaned text are already lowercase)
+        filtered_tokens = self.remove_stopwords(tokens, lowercase=False)
         
         return filtered_tokens
     
@@ -151,29 +358,9 @@ class TextProcessor:
         Returns:
             Normalized text
         """
-        # Common skill term variations
-        normalizations = {
-            'js': 'javascript',
-            'ts': 'typescript',
-            'py': 'python',
-            'ml': 'machine learning',
-            'dl': 'deep learning',
-            'nlp': 'natural language processing',
-            'cv': 'computer vision',
-            'ai': 'artificial intelligence',
-            'ci/cd': 'ci/cd',
-            'devops': 'devops',
-            'ui/ux': 'ui ux',
-            'fullstack': 'full stack',
-            'full-stack': 'full stack',
-            'back end': 'backend',
-            'back-end': 'backend',
-            'front end': 'frontend',
-            'front-end': 'frontend',
-        }
-        
         normalized_text = text.lower()
-        for old, new in normalizations.items():
-            normalized_text = re.sub(r'\b' + re.escape(old) + r'\b', new, normalized_text)
-        
-        return normalized_text
+        return self._normalization_pattern.sub(self._replace_normalized_term, normalized_text)
+    
+    def _replace_normalized_term(self, match: 're.Match') -> str:
+        """Dictionary lookup used as the substitution callback"""
+        return self.normalizations[match.group(0)]
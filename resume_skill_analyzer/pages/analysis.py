@@ -4,22 +4,21 @@ Main analysis functionality with resume upload and skill analysis
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import json
 import sys
 import os
+from datetime import datetime
 from typing import Dict, List
 
 # Add modules to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'nlp_modules'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 
-from nlp_modules.skill_extractor import SkillExtractor
-from utils.pdf_extractor import PDFExtractor
-from utils.skill_analyzer import SkillAnalyzer
+from utils.analysis_engine import get_analysis_engine
+from utils.streamlit_extractor import StreamlitPDFExtractor
+from utils.upload_buffer import UploadBuffer
+from utils.result_cache import get_result_cache, make_cache_key
+from utils.resume_pipeline import extract_skills_from_text
 from utils.shared import set_custom_css, create_progress_ring, create_skill_bar_chart, create_skill_radar_chart, display_skill_cards
 
 def show_analysis_page():
@@ -70,7 +69,9 @@ def show_analysis_page():
         job_skills_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'job_skills.json')
         
         try:
-            skill_extractor = SkillExtractor(job_skills_path)
+            # Shared per process; rebuilt only when job_skills.json changes
+            engine = get_analysis_engine(job_skills_path)
+            skill_extractor = engine.skill_extractor
             job_roles = skill_extractor.get_all_job_roles()
             selected_job_role = st.selectbox(
                 "Choose your target role",
@@ -127,9 +128,19 @@ def show_analysis_page():
         if uploaded_file.name.lower().endswith('.pdf') and uploaded_file.size < 1000:
             st.warning("⚠️ The PDF file seems too small. Please ensure it contains your resume content.")
         
+        # Read the upload once; hashing, type sniffing and decoding share it
+        upload = UploadBuffer.from_upload(uploaded_file)
+        
+        # Reuse earlier results for the same file and skill database
+        result_cache = get_result_cache()
+        cache_key = make_cache_key(upload.content_hash(), engine.fingerprint)
+        cached_result = result_cache.get(cache_key) or {}
+        
         # Extract text from uploaded file
         with st.spinner("📄 Extracting text from resume..."):
-            resume_text = PDFExtractor.extract_text_from_uploaded_file(uploaded_file)
+            resume_text = cached_result.get('text')
+            if resume_text is None:
+                resume_text = StreamlitPDFExtractor.extract_text_from_buffer(upload, cache_key)
             
             if resume_text is None or resume_text.strip() == "":
                 st.error("❌ Failed to extract text from the uploaded file. The file might be corrupted or empty. Please try a different file.")
@@ -145,7 +156,9 @@ def show_analysis_page():
         with st.spinner("🧠 Analyzing skills with NLP..."):
             try:
                 # Extract skills from resume
-                resume_skills = skill_extractor.extract_skills_combined(resume_text)
+                resume_skills = cached_result.get('skills')
+                if resume_skills is None:
+                    resume_skills = extract_skills_from_text(resume_text, engine, cache_key, result_cache)
                 
                 # Validate extracted skills
                 if not resume_skills:
@@ -161,8 +174,9 @@ def show_analysis_page():
                     return
                 
                 # Perform skill gap analysis
-                skill_analyzer = SkillAnalyzer()
-                analysis_results = skill_analyzer.analyze_skill_gaps(resume_skills, required_skills)
+                skill_analyzer = engine.skill_analyzer
+                resume_skill_set = skill_extractor.skill_registry.skill_set(resume_skills)
+                analysis_results = skill_analyzer.analyze_skill_gaps(resume_skill_set, required_skills)
                 
                 # Validate analysis results
                 if not analysis_results:
@@ -170,9 +184,9 @@ def show_analysis_page():
                     return
                 
                 # Get category analysis
-                skill_categories = skill_extractor.categorize_skills(list(resume_skills.keys()))
+                skill_categories = skill_extractor.categorize_skills(resume_skill_set)
                 category_analysis = skill_analyzer.get_skill_category_analysis(
-                    resume_skills, required_skills, skill_extractor.job_skills_data['technical_skills_database']
+                    resume_skill_set, required_skills, skill_extractor.job_skills_data['technical_skills_database']
                 )
                 
                 # Store results
@@ -300,7 +314,7 @@ def show_analysis_page():
         # Create downloadable report
         report_data = {
             'job_role': selected_job_role,
-            'analysis_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'summary': {
                 'match_percentage': results['match_percentage'],
                 'similarity_score': results['similarity_score'],
@@ -327,6 +341,8 @@ def show_analysis_page():
         
         with col2:
             if st.button("📊 Download CSV Report"):
+                import pandas as pd
+                
                 df = pd.DataFrame({
                     'Metric': ['Match Percentage', 'Similarity Score', 'Proficiency Level', 'Total Required Skills', 'Total Matched Skills', 'Total Missing Skills'],
                     'Value': [results['match_percentage'], results['similarity_score'], results['proficiency_level'], results['total_required_skills'], results['total_matched_skills'], results['total_missing_skills']]
@@ -0,0 +1,398 @@
+"""
+Local Analysis Service
+Small HTTP/1.1 service exposing resume extraction and analysis to other
+local systems, with no Streamlit and no network dependencies.
+
+An asyncio event loop accepts requests; the CPU-bound extraction and
+analysis run in an EngineWorkerPool. At most --max-pending requests are
+queued for the workers, and further requests get 503 until the queue drains.
+Identical concurrent requests (same body, endpoint and parameters) share
+one worker task.
+
+Endpoints (resume bytes, PDF or text, are sent as the raw request body):
+    POST /extract                        -> text, skills and warnings
+    POST /analyze?role=R1&role=R2        -> analyze_skill_gaps results per role
+    POST /rank-roles?top=5               -> roles ranked by match percentage
+    GET  /health                         -> status and queue depth
+
+Usage (from the repository root):
+    python -m resume_skill_analyzer.service --port 8765 --workers 4
+    curl --data-binary @resume.pdf 'http://127.0.0.1:8765/analyze?role=Data%20Scientist'
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import signal
+import sys
+from http import HTTPStatus
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# Add modules to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.analysis_engine import get_analysis_engine
+from utils.result_cache import get_result_cache
+from utils.resume_pipeline import analyze_roles, extract_resume_skills
+from utils.single_flight import get_single_flight, single_flight_stats
+from utils.upload_buffer import UploadBuffer
+from utils.worker_pool import DEFAULT_MAX_TASKS_PER_CHILD, EngineWorkerPool
+
+DEFAULT_JOB_SKILLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'job_skills.json')
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_PENDING_PER_WORKER = 4
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_HEADER_BYTES = 64 * 1024
+HEADER_TIMEOUT = 10.0  # Seconds allowed to receive the request line and headers
+BODY_TIMEOUT = 30.0  # Seconds allowed to receive the request body
+TASK_TIMEOUT = 120.0  # Seconds a request waits for its worker result
+# Seconds after a timeout before a task that never answered (lost with a
+# crashed worker) stops counting against the queue bound
+LOST_TASK_TIMEOUT = 4 * TASK_TIMEOUT
+
+
+# ---------------------------------------------------------------------------
+# Worker side: these run in the EngineWorkerPool processes
+
+_worker_job_skills_path = None
+
+
+def _init_service_worker(job_skills_path: str):
+    """Record the skill database path in each worker"""
+    global _worker_job_skills_path
+    _worker_job_skills_path = job_skills_path
+
+
+def _extract(data: bytes, declared_type: Optional[str]):
+    """Extract one resume, returning (engine, upload, extracted) for the tasks below"""
+    engine = get_analysis_engine(_worker_job_skills_path)
+    upload = UploadBuffer(data, declared_type=declared_type)
+    return engine, upload, extract_resume_skills(upload, engine, get_result_cache())
+
+
+def _error_response(upload: UploadBuffer, extracted: Dict) -> Tuple[int, Dict]:
+    return HTTPStatus.UNPROCESSABLE_ENTITY, {
+        'sha256': upload.content_hash(),
+        'error': extracted['error'],
+        'warnings': extracted['warnings'],
+    }
+
+
+def _extract_task(data: bytes, declared_type: Optional[str]) -> Tuple[int, Dict]:
+    """POST /extract"""
+    _, upload, extracted = _extract(data, declared_type)
+    if 'error' in extracted:
+        return _error_response(upload, extracted)
+    return HTTPStatus.OK, {'sha256': upload.content_hash(), **extracted}
+
+
+def _analyze_task(data: bytes, declared_type: Optional[str], roles: List[str]) -> Tuple[int, Dict]:
+    """POST /analyze"""
+    engine, upload, extracted = _extract(data, declared_type)
+    if 'error' in extracted:
+        return _error_response(upload, extracted)
+    return HTTPStatus.OK, {
+        'sha256': upload.content_hash(),
+        'skills_found': len(extracted['skills']),
+        'warnings': extracted['warnings'],
+        'roles': analyze_roles(engine, extracted['skills'], roles),
+    }
+
+
+def _rank_roles_task(data: bytes, declared_type: Optional[str], top: Optional[int]) -> Tuple[int, Dict]:
+    """POST /rank-roles"""
+    engine, upload, extracted = _extract(data, declared_type)
+    if 'error' in extracted:
+        return _error_response(upload, extracted)
+    return HTTPStatus.OK, {
+        'sha256': upload.content_hash(),
+        'skills_found': len(extracted['skills']),
+        'warnings': extracted['warnings'],
+        'roles': engine.role_matrix.best_fit_roles(extracted['skills'], top),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Front end: asyncio HTTP handling in the parent process
+
+class HTTPError(Exception):
+    """Request that is answered with an error status before reaching a worker"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class AnalysisService:
+    """Asyncio HTTP front end that queues CPU work on an EngineWorkerPool"""
+
+    def __init__(self, pool: EngineWorkerPool, job_roles: List[str], max_pending: int):
+        """
+        Args:
+            pool: Worker pool built with _init_service_worker as initializer
+            job_roles: Role names accepted by /analyze
+            max_pending: Requests that may wait for or run in workers at once
+        """
+        self.pool = pool
+        self.job_roles = job_roles
+        self.max_pending = max_pending
+        self.pending = 0  # Requests waiting for a worker result
+        self.on_pool = 0  # Tasks queued or running on the pool, including abandoned ones
+        self.stats = {'requests': 0, 'completed': 0, 'rejected': 0, 'timeouts': 0, 'errors': 0}
+        self.flight = get_single_flight('service_requests')
+
+    def _submit(self, func, *args) -> Tuple[asyncio.Future, Callable[[], None]]:
+        """
+        Queue func(*args) on the pool
+
+        Returns:
+            Tuple of (future resolved on the event loop, abandon function).
+            The task counts in pending and on_pool until the worker answers;
+            abandon() takes it out of pending at once but leaves it on_pool,
+            since the worker is still busy, until it answers or
+            LOST_TASK_TIMEOUT passes
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        held = {'pending': True, 'on_pool': True}
+
+        def release(counter: str):
+            if held[counter]:
+                held[counter] = False
+                setattr(self, counter, getattr(self, counter) - 1)
+
+        def abandon():
+            release('pending')
+            loop.call_later(LOST_TASK_TIMEOUT, release, 'on_pool')
+
+        def settle(setter, value):
+            release('pending')
+            release('on_pool')
+            if not future.done():
+                setter(value)
+
+        def notify(setter, value):
+            # Runs in the pool's result thread
+            try:
+                loop.call_soon_threadsafe(settle, setter, value)
+            except RuntimeError:
+                pass  # The event loop has closed during shutdown
+
+        self.pending += 1
+        self.on_pool += 1
+        self.pool.apply_async(
+            func, args,
+            callback=lambda result: notify(future.set_result, result),
+            error_callback=lambda error: notify(future.set_exception, error),
+        )
+        return future, abandon
+
+    async def _read_request(self, reader: asyncio.StreamReader):
+        """Parse the request line, headers and body"""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), HEADER_TIMEOUT)
+        except asyncio.LimitOverrunError:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Request headers are too large.")
+
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, _ = lines[0].split(' ', 2)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            if name:
+                headers[name.strip().lower()] = value.strip()
+
+        body = b''
+        if method == 'POST':
+            if 'chunked' in headers.get('transfer-encoding', '').lower():
+                raise HTTPError(HTTPStatus.LENGTH_REQUIRED, "Send the resume with a Content-Length header.")
+            length = headers.get('content-length', '0')
+            # isdigit() alone accepts non-ASCII digits; int() alone accepts signs
+            if not (length.isascii() and length.isdigit()):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length header.")
+            length = int(length)
+            if length > MAX_BODY_BYTES:
+                raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                f"Resume exceeds {MAX_BODY_BYTES // (1024 * 1024)} MB.")
+            body = await asyncio.wait_for(reader.readexactly(length), BODY_TIMEOUT)
+        return method, target, headers, body
+
+    def _parse_roles(self, query: Dict[str, List[str]]) -> List[str]:
+        roles = query.get('role') or self.job_roles
+        unknown_roles = [role for role in roles if role not in self.job_roles]
+        if unknown_roles:
+            raise HTTPError(HTTPStatus.BAD_REQUEST,
+                            f"Unknown job role(s): {', '.join(unknown_roles)}.")
+        return roles
+
+    @staticmethod
+    def _parse_top(query: Dict[str, List[str]]) -> Optional[int]:
+        if 'top' not in query:
+            return None
+        try:
+            top = int(query['top'][0])
+        except ValueError:
+            top = 0
+        if top < 1:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "top must be a positive integer.")
+        return top
+
+    async def _dispatch(self, method: str, target: str, headers: Dict[str, str],
+                        body: bytes) -> Tuple[int, Dict]:
+        """Route one request and return (status, JSON payload)"""
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+
+        if url.path == '/health':
+            if method != 'GET':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET.")
+            return HTTPStatus.OK, {
+                'status': 'ok',
+                'pending': self.pending,
+                'on_pool': self.on_pool,
+                'max_pending': self.max_pending,
+                'workers': self.pool.workers,
+                **self.stats,
+                # Counters of this process's single flights by name; the
+                # extraction flights run inside the workers
+                'single_flight': single_flight_stats(),
+            }
+
+        if url.path == '/extract':
+            task = (_extract_task,)
+        elif url.path == '/analyze':
+            task = (_analyze_task, self._parse_roles(query))
+        elif url.path == '/rank-roles':
+            task = (_rank_roles_task, self._parse_top(query))
+        else:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {url.path}")
+
+        if method != 'POST':
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "POST the resume file as the request body.")
+        if not body:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "The request body is empty; POST a PDF or text resume.")
+
+        async def run_task():
+            # Tasks abandoned after a timeout still occupy a worker, so the
+            # bound applies to on_pool (which is never below pending)
+            if self.on_pool >= self.max_pending:
+                self.stats['rejected'] += 1
+                raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "The analyzer is busy; retry shortly.")
+            func, *args = task
+            future, abandon = self._submit(func, body, headers.get('content-type'), *args)
+            try:
+                return await asyncio.wait_for(future, TASK_TIMEOUT)
+            except asyncio.TimeoutError:
+                abandon()
+                self.stats['timeouts'] += 1
+                raise HTTPError(HTTPStatus.GATEWAY_TIMEOUT, "The analysis took too long.")
+
+        # Identical requests in flight share one worker task and hold no
+        # queue slot of their own
+        key = (hashlib.sha256(body).hexdigest(), url.path, json.dumps(task[1:]))
+        status, payload = await self.flight.do_async(key, run_task)
+        self.stats['completed'] += 1
+        return status, payload
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one request per connection"""
+        self.stats['requests'] += 1
+        extra_headers = ''
+        try:
+            request = await self._read_request(reader)
+            status, payload = await self._dispatch(*request)
+        except HTTPError as e:
+            status, payload = e.status, {'error': e.message}
+            if e.status == HTTPStatus.SERVICE_UNAVAILABLE:
+                extra_headers = 'Retry-After: 1\r\n'
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            writer.close()
+            return
+        except Exception as e:
+            self.stats['errors'] += 1
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"{type(e).__name__}: {e}"}
+
+        body = json.dumps(payload).encode('utf-8')
+        status = HTTPStatus(status)
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{extra_headers}"
+            f"Connection: close\r\n\r\n".encode('latin-1') + body
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(service: AnalysisService, host: str, port: int):
+    """Run the HTTP server until SIGINT or SIGTERM"""
+    server = await asyncio.start_server(service.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C raises KeyboardInterrupt instead
+
+    print(f"Resume analysis service on http://{host}:{port} "
+          f"({service.pool.workers} workers, max {service.max_pending} pending)", file=sys.stderr, flush=True)
+    async with server:
+        await stop.wait()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m resume_skill_analyzer.service',
+        description="Serve resume extraction and analysis over local HTTP."
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST,
+                        help=f"Interface to listen on (default: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument('--max-pending', type=int,
+                        help="Requests queued for the workers before answering 503 "
+                             f"(default: {DEFAULT_PENDING_PER_WORKER} per worker)")
+    parser.add_argument('--max-tasks-per-child', type=int, default=DEFAULT_MAX_TASKS_PER_CHILD,
+                        help="Tasks a worker runs before it is replaced; 0 never replaces workers "
+                             f"(default: {DEFAULT_MAX_TASKS_PER_CHILD})")
+    parser.add_argument('--job-skills', default=DEFAULT_JOB_SKILLS_PATH,
+                        help="Path to job_skills.json")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    with open(args.job_skills, 'r') as f:
+        job_roles = list(json.load(f)['job_roles'])
+    max_pending = args.max_pending or args.workers * DEFAULT_PENDING_PER_WORKER
+
+    pool = EngineWorkerPool(args.job_skills, args.workers, args.max_tasks_per_child or None,
+                            initializer=_init_service_worker, initargs=(args.job_skills,))
+    try:
+        asyncio.run(serve(AnalysisService(pool, job_roles, max_pending), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.terminate()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
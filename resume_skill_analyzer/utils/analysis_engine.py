@@ -0,0 +1,79 @@
+"""
+Analysis Engine Module
+Process-wide cache of the compiled skill extraction and analysis objects
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, Tuple
+
+from nlp_modules.skill_extractor import SkillExtractor
+from utils.skill_analyzer import SkillAnalyzer, RoleSkillMatrix
+
+
+class AnalysisEngine:
+    """Skill extractor, analyzer and role matrix built from one skill database"""
+
+    def __init__(self, job_skills_path: str):
+        """
+        Build every component from the job skills database
+
+        Args:
+            job_skills_path: Path to job_skills.json file
+        """
+        self.job_skills_path = job_skills_path
+        with open(job_skills_path, 'rb') as f:
+            self.fingerprint = hashlib.sha256(f.read()).hexdigest()
+
+        self.skill_extractor = SkillExtractor(job_skills_path)
+        job_roles = self.skill_extractor.job_skills_data['job_roles']
+        self.skill_analyzer = SkillAnalyzer(job_roles, self.skill_extractor.skill_registry)
+        self.role_matrix = RoleSkillMatrix(job_roles, self.skill_extractor.skill_registry)
+
+    def warm_up(self):
+        """
+        Analyze a short text against every role once
+
+        The role vectors and skill term weights are built by the constructor;
+        this pays for the remaining first-call work, such as lazily imported
+        modules, before workers are forked.
+        """
+        roles = self.skill_extractor.get_all_job_roles()
+        warm_up_text = ' '.join(self.skill_extractor.get_job_role_skills(roles[0])) if roles else ''
+        resume_skills = self.skill_extractor.extract_skill_set(warm_up_text)
+        for role in roles:
+            self.skill_analyzer.analyze_skill_gaps(
+                resume_skills, self.skill_extractor.get_job_role_skills(role)
+            )
+
+
+_engines: Dict[str, Tuple[Tuple[int, int], AnalysisEngine]] = {}
+_engines_lock = threading.Lock()
+
+
+def get_analysis_engine(job_skills_path: str) -> AnalysisEngine:
+    """
+    Return the shared engine for a skill database, building it on first use
+
+    The engine is rebuilt only when the file's modification time or size
+    changes, so Streamlit reruns and worker tasks reuse the same instance.
+
+    Args:
+        job_skills_path: Path to job_skills.json file
+
+    Returns:
+        Shared AnalysisEngine instance
+    """
+    path = os.path.abspath(job_skills_path)
+    stat = os.stat(path)
+    file_state = (stat.st_mtime_ns, stat.st_size)
+
+    with _engines_lock:
+        cached = _engines.get(path)
+        if cached is not None and cached[0] == file_state:
+            return cached[1]
+
+        engine = AnalysisEngine(path)
+        _engines[path] = (file_state, engine)
+        return engine
@@ -0,0 +1,176 @@
+"""
+Disk Cache Module
+SQLite-backed result cache shared by every process on the same machine
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 100000
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+EVICTION_INTERVAL = 64  # Puts between eviction passes
+# A hit records its access time only if the stored one is older than this,
+# so frequently read entries do not turn every read into a write
+ACCESS_UPDATE_INTERVAL = 300.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+"""
+
+
+class DiskResultCache:
+    """Persistent result cache in SQLite WAL mode with TTL and size eviction"""
+
+    def __init__(self, path: str, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) the cache database
+
+        Args:
+            path: SQLite database file, shared by all processes using the cache
+            ttl_seconds: Entries older than this are treated as misses
+            max_entries: Maximum number of stored results
+            max_bytes: Maximum total size of stored results
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are per thread)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached result dictionary or None if missing or expired (an
+            expired entry is deleted)
+        """
+        now = time.time()
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, created_at, accessed_at FROM results WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self._count(False)
+            return None
+
+        value, created_at, accessed_at = row
+        if now - created_at > self.ttl_seconds:
+            # Matching created_at keeps a fresh value put by another process
+            connection.execute(
+                "DELETE FROM results WHERE key = ? AND created_at = ?", (key, created_at)
+            )
+            self._count(False)
+            return None
+
+        if now - accessed_at > ACCESS_UPDATE_INTERVAL:
+            connection.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        self._count(True)
+        return json.loads(value)
+
+    def put(self, key: str, value: Dict):
+        """
+        Store a result, replacing any previous value for the key
+
+        Args:
+            key: Cache key from make_cache_key
+            value: JSON-serializable result dictionary
+        """
+        payload = json.dumps(value)
+        now = time.time()
+        self._connection().execute(
+            "INSERT OR REPLACE INTO results (key, value, size, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, payload, len(payload), now, now)
+        )
+
+        with self._lock:
+            self._puts += 1
+            run_eviction = self._puts % EVICTION_INTERVAL == 0
+        if run_eviction:
+            self.evict()
+
+    def evict(self):
+        """Delete expired entries, then least recently used ones beyond the limits"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "DELETE FROM results WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            # Keep the most recently used rows that fit both limits
+            connection.execute(
+                "DELETE FROM results WHERE key IN ("
+                "  SELECT key FROM ("
+                "    SELECT key,"
+                "           ROW_NUMBER() OVER (ORDER BY accessed_at DESC) AS position,"
+                "           SUM(size) OVER (ORDER BY accessed_at DESC) AS running_size"
+                "    FROM results"
+                "  ) WHERE position > ? OR running_size > ?"
+                ")",
+                (self.max_entries, self.max_bytes)
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def clear(self):
+        """Drop every cached result"""
+        self._connection().execute("DELETE FROM results")
+
+    def stats(self) -> Dict[str, int]:
+        """Return this process's hit/miss counters and the shared cache usage"""
+        entries, total_bytes = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': entries,
+                'bytes': total_bytes
+            }
@@ -1,11 +1,20 @@
 """
 PDF Text Extraction Module
 Handles PDF text extraction for resume processing
+
+This module has no Streamlit dependency so it can run in worker processes,
+batch jobs and services; utils.streamlit_extractor reports its results in
+the UI.
 """
 
 import io
-from typing import Optional
-import streamlit as st
+import multiprocessing
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from utils.upload_buffer import PDF_TYPE, TEXT_TYPE, UploadBuffer
 
 # Try to import PyPDF2, provide fallback if not available
 try:
@@ -14,6 +23,123 @@ try:
 except ImportError:
     PYPDF2_AVAILABLE = False
 
+# Extraction limits applied to uploaded resumes
+DEFAULT_MAX_PAGES = 50
+DEFAULT_MAX_CHARS = 200_000
+# Opt-in per-page time limit in seconds (see iter_page_texts); off by default
+DEFAULT_PAGE_TIME_BUDGET = None
+
+# Documents with fewer pages than this are extracted serially even when
+# parallel extraction is requested (see benchmarks/bench_pdf_parallel.py)
+PARALLEL_PAGE_THRESHOLD = 16
+CHUNKS_PER_WORKER = 4
+
+
+def _extract_page_text(page, time_budget: Optional[float]) -> Optional[str]:
+    """
+    Extract the text of one page, giving up after time_budget seconds
+    
+    Best effort: extraction runs in a daemon thread when a budget is set,
+    and a thread cannot be stopped, so a page that overruns is only
+    abandoned; its thread keeps running (and holding the GIL at times)
+    until PyPDF2 finishes the page.
+    
+    Returns:
+        Page text, or None if the budget was exceeded
+    """
+    if time_budget is None:
+        return page.extract_text()
+    
+    result = {}
+    
+    def run():
+        try:
+            result['text'] = page.extract_text()
+        except Exception as e:
+            result['error'] = e
+    
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(time_budget)
+    if worker.is_alive():
+        return None
+    if 'error' in result:
+        raise result['error']
+    return result['text']
+
+
+@dataclass
+class ExtractionResult:
+    """Outcome of extracting text from one file"""
+    
+    text: Optional[str] = None
+    error: Optional[str] = None
+    warnings: List[str] = field(default_factory=list)
+    file_type: Optional[str] = None
+    encoding: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        """True if text was extracted"""
+        return self.error is None and self.text is not None
+
+
+# PDF reader of a pool worker, opened once from the buffer passed at startup
+_worker_reader = None
+
+
+def _init_pdf_worker(pdf_bytes: bytes):
+    """Process pool initializer: open the shared PDF buffer once per worker"""
+    global _worker_reader
+    _worker_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+
+
+def _extract_page_range(start: int, stop: int) -> List[str]:
+    """Extract pages start..stop-1 in a pool worker"""
+    return [_worker_reader.pages[page_num].extract_text() for page_num in range(start, stop)]
+
+
+def _read_pdf_bytes(pdf_file) -> bytes:
+    """Return the full contents of a binary file object"""
+    if hasattr(pdf_file, 'getvalue'):
+        return pdf_file.getvalue()
+    pdf_file.seek(0)
+    return pdf_file.read()
+
+
+def _parallel_page_texts(pdf_bytes: bytes, num_pages: int,
+                         time_budget: Optional[float],
+                         max_workers: Optional[int]) -> Iterator[Optional[str]]:
+    """
+    Extract page ranges in a process pool, yielding page texts in page order
+    
+    Each worker opens the PDF once from pdf_bytes; tasks only carry page
+    ranges. Yields None and stops if a range exceeds its time budget; the
+    workers are then terminated, so an overrunning page does not keep
+    running.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(1, -(-num_pages // (workers * CHUNKS_PER_WORKER)))
+    pool = multiprocessing.Pool(workers, initializer=_init_pdf_worker, initargs=(pdf_bytes,))
+    try:
+        results = [
+            pool.apply_async(_extract_page_range, (start, min(start + chunk_size, num_pages)))
+            for start in range(0, num_pages, chunk_size)
+        ]
+        chunk_budget = None if time_budget is None else time_budget * chunk_size
+        for result in results:
+            try:
+                page_texts = result.get(timeout=chunk_budget)
+            except multiprocessing.TimeoutError:
+                yield None
+                return
+            yield from page_texts
+    finally:
+        # Also stops workers still busy when the caller stops early
+        pool.terminate()
+        pool.join()
+
+
 class PDFExtractor:
     """PDF text extraction utility"""
     
@@ -23,73 +149,175 @@ class PDFExtractor:
         return PYPDF2_AVAILABLE
     
     @staticmethod
-    def extract_text_from_pdf(pdf_file) -> Optional[str]:
+    def iter_page_texts(pdf_file, max_pages: Optional[int] = None,
+                        max_chars: Optional[int] = None,
+                        page_time_budget: Optional[float] = None,
+                        parallel: bool = False, max_workers: Optional[int] = None,
+                        parallel_threshold: int = PARALLEL_PAGE_THRESHOLD) -> Iterator[str]:
+        """
+        Yield the text of each non-empty page, one page at a time
+        
+        The file is parsed in place (no copy of the upload) and pages are
+        extracted lazily, so callers can start on early pages. In parallel
+        mode, page ranges are extracted in a process pool and still yielded
+        in page order.
+        
+        Args:
+            pdf_file: Seekable binary file object (e.g. a Streamlit upload)
+            max_pages: Stop after this many pages
+            max_chars: Stop once this many characters have been yielded; the
+                last page is cut to fit
+            page_time_budget: Opt-in seconds allowed per page; extraction
+                stops at the first page (or, in parallel mode, page range)
+                that takes longer. In parallel mode the workers are
+                terminated; serially the page is abandoned in a thread that
+                cannot be stopped, so the limit is best effort.
+            parallel: Extract pages in a process pool
+            max_workers: Pool size in parallel mode (defaults to the CPU count)
+            parallel_threshold: Documents with fewer pages stay serial
+            
+        Returns:
+            Iterator of page texts. Its return value (StopIteration.value)
+            names the limit that cut extraction short, or is None.
+        """
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        total_pages = len(pdf_reader.pages)
+        num_pages = total_pages if max_pages is None else min(total_pages, max_pages)
+        
+        if parallel and num_pages >= parallel_threshold:
+            raw_page_texts = _parallel_page_texts(
+                _read_pdf_bytes(pdf_file), num_pages, page_time_budget, max_workers
+            )
+        else:
+            raw_page_texts = (
+                _extract_page_text(pdf_reader.pages[page_num], page_time_budget)
+                for page_num in range(num_pages)
+            )
+        
+        remaining_chars = max_chars
+        try:
+            for page_num, page_text in enumerate(raw_page_texts):
+                if page_text is None:
+                    return f"page {page_num + 1} took longer than {page_time_budget:g} s"
+                if not page_text.strip():
+                    continue
+                
+                if remaining_chars is not None:
+                    if len(page_text) > remaining_chars:
+                        if remaining_chars:
+                            yield page_text[:remaining_chars]
+                        return f"only the first {max_chars} characters were read"
+                    remaining_chars -= len(page_text)
+                
+                yield page_text
+        finally:
+            # Shuts the process pool down promptly when stopping early
+            raw_page_texts.close()
+        
+        if num_pages < total_pages:
+            return f"only the first {max_pages} pages were read"
+        return None
+    
+    @staticmethod
+    def collect_page_texts(pages: Iterator[str]) -> Tuple[List[str], Optional[str]]:
+        """
+        Drain an iter_page_texts generator
+        
+        Returns:
+            Tuple of (page texts, reason extraction stopped early or None)
+        """
+        page_texts = []
+        while True:
+            try:
+                page_texts.append(next(pages))
+            except StopIteration as stop:
+                return page_texts, stop.value
+    
+    @staticmethod
+    def extract_pdf(pdf_file, max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+                    max_chars: Optional[int] = DEFAULT_MAX_CHARS,
+                    page_time_budget: Optional[float] = DEFAULT_PAGE_TIME_BUDGET,
+                    parallel: bool = False) -> ExtractionResult:
         """
         Extract text from PDF file
         
         Args:
-            pdf_file: Uploaded PDF file
+            pdf_file: Binary file object holding a PDF
+            max_pages: Maximum number of pages to read (None for no limit)
+            max_chars: Maximum number of characters to extract (None for no limit)
+            page_time_budget: Opt-in seconds allowed per page (None for no
+                limit; best effort unless parallel, see iter_page_texts)
+            parallel: Extract long documents in a process pool
             
         Returns:
-            Extracted text or None if extraction fails
+            ExtractionResult with the text, or an error message
         """
         if not PYPDF2_AVAILABLE:
-            st.error("PyPDF2 is not installed. Please install it using: pip install PyPDF2")
-            return None
+            return ExtractionResult(
+                error="PyPDF2 is not installed. Please install it using: pip install PyPDF2"
+            )
         
         try:
-            # Read PDF file
-            pdf_bytes = pdf_file.read()
-            pdf_stream = io.BytesIO(pdf_bytes)
-            
-            # Create PDF reader
-            pdf_reader = PyPDF2.PdfReader(pdf_stream)
-            
-            # Extract text from all pages
-            text = ""
-            for page_num, page in enumerate(pdf_reader.pages):
-                page_text = page.extract_text()
-                if page_text.strip():
-                    text += page_text + "\n"
-            
-            return text.strip()
-            
+            pages = PDFExtractor.iter_page_texts(
+                pdf_file, max_pages, max_chars, page_time_budget, parallel=parallel
+            )
+            page_texts, stop_reason = PDFExtractor.collect_page_texts(pages)
         except Exception as e:
-            st.error(f"Error extracting text from PDF: {str(e)}")
-            return None
+            return ExtractionResult(error=f"Error extracting text from PDF: {str(e)}")
+        
+        result = ExtractionResult(text="\n".join(page_texts).strip())
+        if stop_reason:
+            result.warnings.append(f"The PDF was only partially analyzed: {stop_reason}.")
+        return result
     
     @staticmethod
-    def extract_text_from_uploaded_file(uploaded_file) -> Optional[str]:
+    def extract_buffer(upload: UploadBuffer, **pdf_options) -> ExtractionResult:
         """
-        Extract text from uploaded file (PDF or text)
+        Extract text from an upload read into an UploadBuffer
+        
+        The file type is detected from the content's magic bytes rather
+        than the client-declared MIME type. An upload declared or named as
+        a PDF without a PDF header is rejected rather than read as text.
         
         Args:
-            uploaded_file: Streamlit uploaded file object
+            upload: Buffer holding the whole upload
+            **pdf_options: Limits passed on to extract_pdf
             
         Returns:
-            Extracted text or None if extraction fails
+            ExtractionResult with the text, or an error message
         """
-        if uploaded_file is None:
-            return None
+        file_type = upload.sniff_type()
         
-        # Check file type
-        file_type = uploaded_file.type
-        
-        if file_type == "application/pdf":
-            return PDFExtractor.extract_text_from_pdf(uploaded_file)
-        elif file_type in ["text/plain", "text/csv"]:
-            # For text files, read directly
-            try:
-                # Handle different encodings
-                text = uploaded_file.read().decode('utf-8')
-                return text
-            except UnicodeDecodeError:
-                try:
-                    text = uploaded_file.read().decode('latin-1')
-                    return text
-                except Exception as e:
-                    st.error(f"Error reading text file: {str(e)}")
-                    return None
+        if file_type == PDF_TYPE:
+            result = PDFExtractor.extract_pdf(upload.stream(), **pdf_options)
+        elif upload.declares_pdf():
+            result = ExtractionResult(
+                error="The file is not a valid PDF (no PDF header was found). "
+                      "Please upload the original PDF or a text file."
+            )
+        elif file_type == TEXT_TYPE:
+            text, encoding = upload.decode_text()
+            result = ExtractionResult(text=text, encoding=encoding)
         else:
-            st.error(f"Unsupported file type: {file_type}. Please upload PDF or text files.")
-            return None
+            result = ExtractionResult(
+                error=f"Unsupported file type: {file_type}. Please upload PDF or text files."
+            )
+        result.file_type = file_type
+        return result
+    
+    @staticmethod
+    def extract_uploaded_file(uploaded_file, **pdf_options) -> ExtractionResult:
+        """
+        Extract text from an uploaded file (PDF or text)
+        
+        Args:
+            uploaded_file: Binary file object, such as a Streamlit upload
+            **pdf_options: Limits passed on to extract_pdf
+            
+        Returns:
+            ExtractionResult with the text, or an error message
+        """
+        if uploaded_file is None:
+            return ExtractionResult(error="No file was uploaded.")
+        
+        return PDFExtractor.extract_buffer(UploadBuffer.from_upload(uploaded_file), **pdf_options)
@@ -0,0 +1,184 @@
+"""
+Result Cache Module
+Bounded in-process LRU cache for extracted resume text and skill scores
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from utils.disk_cache import DiskResultCache
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Set to a SQLite file path to share results across server processes
+DISK_CACHE_ENV_VAR = 'RESUME_ANALYZER_CACHE_PATH'
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest of uploaded file contents"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def make_cache_key(file_hash: str, skill_db_fingerprint: str) -> str:
+    """Combine a content hash with the skill database fingerprint"""
+    return f"{file_hash}:{skill_db_fingerprint}"
+
+
+def _estimate_size(value: Any) -> int:
+    """Rough payload size in bytes of a cached value"""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_size(item) for item in value)
+    return 8
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by entry count and total payload bytes"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize an empty cache
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum estimated payload size of all cached results
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result and mark it as recently used
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached result dictionary or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Dict):
+        """
+        Store a result, evicting least recently used entries to stay in bounds
+
+        Args:
+            key: Cache key from make_cache_key
+            value: Result dictionary (e.g. {'text': ..., 'skills': ...})
+        """
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self._total_bytes += size
+
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current usage"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes
+            }
+
+
+class LayeredResultCache:
+    """In-process LRU in front of a persistent cache shared between processes"""
+
+    def __init__(self, memory_cache: ResultCache, disk_cache: DiskResultCache):
+        """
+        Args:
+            memory_cache: Process-local ResultCache
+            disk_cache: Cache shared with other processes
+        """
+        self.memory_cache = memory_cache
+        self.disk_cache = disk_cache
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Look up memory first, then disk, promoting disk hits into memory"""
+        value = self.memory_cache.get(key)
+        if value is None:
+            value = self.disk_cache.get(key)
+            if value is not None:
+                self.memory_cache.put(key, value)
+        return value
+
+    def put(self, key: str, value: Dict):
+        """Store a result in both layers"""
+        self.memory_cache.put(key, value)
+        self.disk_cache.put(key, value)
+
+    def clear(self):
+        """Drop every cached result in both layers"""
+        self.memory_cache.clear()
+        self.disk_cache.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the counters of both layers"""
+        return {'memory': self.memory_cache.stats(), 'disk': self.disk_cache.stats()}
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_result_cache(max_entries: int = DEFAULT_MAX_ENTRIES,
+                     max_bytes: int = DEFAULT_MAX_BYTES):
+    """
+    Return the process-wide result cache, creating it on first use
+
+    When RESUME_ANALYZER_CACHE_PATH is set, the in-process LRU is layered
+    over a SQLite cache at that path so replicas and batch runs share work.
+
+    Args:
+        max_entries: Entry limit used when the cache is created
+        max_bytes: Byte limit used when the cache is created
+
+    Returns:
+        Shared ResultCache or LayeredResultCache instance
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResultCache(max_entries, max_bytes)
+            disk_cache_path = os.environ.get(DISK_CACHE_ENV_VAR)
+            if disk_cache_path:
+                _shared_cache = LayeredResultCache(_shared_cache, DiskResultCache(disk_cache_path))
+        return _shared_cache
@@ -0,0 +1,106 @@
+"""
+Resume Pipeline Module
+Streamlit-free extraction and analysis steps shared by the app, the batch
+runner and the HTTP service
+"""
+
+from typing import Dict, List, Optional
+
+from utils.analysis_engine import AnalysisEngine
+from utils.pdf_extractor import PDFExtractor
+from utils.result_cache import make_cache_key
+from utils.single_flight import get_single_flight
+from utils.upload_buffer import UploadBuffer
+
+
+def extract_resume_skills(upload: UploadBuffer, engine: AnalysisEngine,
+                          result_cache=None) -> Dict:
+    """
+    Extract the text and skills of one resume, reusing cached results
+
+    Concurrent calls for the same file and skill database share one
+    extraction through the 'resume_extraction' single flight.
+
+    Args:
+        upload: Buffer holding the resume file
+        engine: Analysis engine for the skill database
+        result_cache: Optional cache from utils.result_cache
+
+    Returns:
+        Dictionary with 'text' and 'skills', or 'error'; 'warnings' lists
+        extraction limits that were hit
+    """
+    cache_key = make_cache_key(upload.content_hash(), engine.fingerprint)
+
+    if result_cache is not None:
+        cached_result = result_cache.get(cache_key)
+        if cached_result is not None:
+            return {**cached_result, 'warnings': []}
+
+    def extract():
+        extraction = PDFExtractor.extract_buffer(upload)
+        if not extraction.ok:
+            return {'error': extraction.error, 'warnings': extraction.warnings}
+        if not extraction.text.strip():
+            return {'error': "No text could be extracted from the file.", 'warnings': extraction.warnings}
+
+        result = {
+            'text': extraction.text,
+            'skills': engine.skill_extractor.extract_skills_combined(extraction.text),
+        }
+        if result_cache is not None:
+            result_cache.put(cache_key, result)
+        return {**result, 'warnings': extraction.warnings}
+
+    return get_single_flight('resume_extraction').do(cache_key, extract)
+
+
+def extract_skills_from_text(resume_text: str, engine: AnalysisEngine, cache_key: str,
+                             result_cache=None) -> Dict[str, float]:
+    """
+    Extract skills from already extracted resume text and cache the result
+
+    Concurrent calls with the same cache key share one extraction through
+    the 'resume_skills' single flight.
+
+    Args:
+        resume_text: Text extracted from the resume
+        engine: Analysis engine for the skill database
+        cache_key: Key from make_cache_key for the resume and skill database
+        result_cache: Optional cache from utils.result_cache
+
+    Returns:
+        Skills and scores from extract_skills_combined
+    """
+    def extract():
+        resume_skills = engine.skill_extractor.extract_skills_combined(resume_text)
+        if result_cache is not None:
+            result_cache.put(cache_key, {'text': resume_text, 'skills': resume_skills})
+        return resume_skills
+
+    return get_single_flight('resume_skills').do(cache_key, extract)
+
+
+def analyze_roles(engine: AnalysisEngine, resume_skills: Dict[str, float],
+                  roles: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """
+    Run the skill gap analysis of one resume against several job roles
+
+    Args:
+        engine: Analysis engine for the skill database
+        resume_skills: Skills and scores from extract_skills_combined, or a SkillSet
+        roles: Job role names (defaults to every role in the database)
+
+    Returns:
+        Dictionary of role name to analyze_skill_gaps results
+    """
+    if roles is None:
+        roles = engine.skill_extractor.get_all_job_roles()
+    # Look the skills up once; every role then matches on skill IDs
+    resume_skill_set = engine.skill_extractor.skill_registry.skill_set(resume_skills)
+    return {
+        role: engine.skill_analyzer.analyze_skill_gaps(
+            resume_skill_set, engine.skill_extractor.get_job_role_skills(role)
+        )
+        for role in roles
+    }
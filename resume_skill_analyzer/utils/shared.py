@@ -4,9 +4,11 @@ Common functions and styling used across multiple pages
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
+
+# plotly is imported by the chart builders, on first render of a chart
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 def set_custom_css():
     """Apply attractive black theme styling"""
@@ -351,8 +353,10 @@ def set_custom_css():
     </script>
     """, unsafe_allow_html=True)
 
-def create_progress_ring(percentage: float, title: str) -> go.Figure:
+def create_progress_ring(percentage: float, title: str) -> 'go.Figure':
     """Create a circular progress indicator"""
+    import plotly.graph_objects as go
+    
     color = '#22c55e' if percentage >= 70 else '#eab308' if percentage >= 40 else '#ef4444'
     fig = go.Figure(data=[go.Pie(
         values=[percentage, 100 - percentage],
@@ -375,8 +379,10 @@ def create_progress_ring(percentage: float, title: str) -> go.Figure:
     
     return fig
 
-def create_skill_bar_chart(matched_skills: List[str], missing_skills: List[str]) -> go.Figure:
+def create_skill_bar_chart(matched_skills: List[str], missing_skills: List[str]) -> 'go.Figure':
     """Create a bar chart for skills"""
+    import plotly.graph_objects as go
+    
     fig = go.Figure(data=[
         go.Bar(
             x=['Matched', 'Missing'],
@@ -401,8 +407,10 @@ def create_skill_bar_chart(matched_skills: List[str], missing_skills: List[str])
     
     return fig
 
-def create_skill_radar_chart(skill_analysis: Dict, skill_categories: Dict) -> go.Figure:
+def create_skill_radar_chart(skill_analysis: Dict, skill_categories: Dict) -> 'go.Figure':
     """Create radar chart for skill categories"""
+    import plotly.graph_objects as go
+    
     if not skill_categories:
         return go.Figure()
     
@@ -0,0 +1,147 @@
+"""
+Single-Flight Module
+Coalesces concurrent identical computations so they run once and share a result
+
+Callers use a key such as the upload's content hash. The first caller for a
+key (the leader) runs the computation; callers that arrive while it is in
+flight wait for it and receive the same result or exception. Keys are
+forgotten as soon as the leader finishes, so this complements the result
+cache rather than replacing it.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """Thread-safe, asyncio-aware registry of in-flight computations"""
+
+    def __init__(self):
+        self.calls = 0
+        self.executions = 0
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, key: Hashable) -> Tuple[Future, bool]:
+        """
+        Join the computation for a key, or become its leader
+
+        The leader must finish the key with resolve(); callers that are not
+        the leader wait on the returned future.
+
+        Args:
+            key: Identity of the computation (e.g. a content hash)
+
+        Returns:
+            Tuple of (future holding the shared result, True for the leader)
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            self.executions += 1
+            return future, True
+
+    def resolve(self, key: Hashable, result: Any = None, error: BaseException = None):
+        """
+        Finish the computation for a key and hand the outcome to every waiter
+
+        Args:
+            key: Key previously claimed by the leader
+            result: Value returned to the waiters
+            error: Exception raised in the waiters instead of a result
+        """
+        with self._lock:
+            future = self._in_flight.pop(key)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run func once for all threads that ask for the same key concurrently
+
+        Args:
+            key: Identity of the computation
+            func: Computation run by the leader
+
+        Returns:
+            The leader's result (the leader's exception is raised instead)
+        """
+        future, leader = self.claim(key)
+        if not leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as e:
+            self.resolve(key, error=e)
+            raise
+        self.resolve(key, result)
+        return result
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable]) -> Any:
+        """
+        Await func() once for all coroutines that ask for the same key concurrently
+
+        Args:
+            key: Identity of the computation
+            func: Coroutine function awaited by the leader
+
+        Returns:
+            The leader's result (the leader's exception is raised instead)
+        """
+        future, leader = self.claim(key)
+        if not leader:
+            # shield() keeps a waiter's cancellation from cancelling the leader's future
+            return await asyncio.shield(asyncio.wrap_future(future))
+        try:
+            result = await func()
+        except BaseException as e:
+            self.resolve(key, error=e)
+            raise
+        self.resolve(key, result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Return call counts; 'saved' is the number of computations avoided"""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'executions': self.executions,
+                'saved': self.calls - self.executions,
+                'in_flight': len(self._in_flight),
+            }
+
+
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Return the process-wide SingleFlight for a kind of computation
+
+    Args:
+        name: Computation name, e.g. 'resume_skills'
+
+    Returns:
+        Shared SingleFlight instance
+    """
+    with _flights_lock:
+        flight = _flights.get(name)
+        if flight is None:
+            flight = _flights[name] = SingleFlight()
+        return flight
+
+
+def single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """Return the counters of every process-wide SingleFlight by name"""
+    with _flights_lock:
+        flights = dict(_flights)
+    return {name: flight.stats() for name, flight in flights.items()}
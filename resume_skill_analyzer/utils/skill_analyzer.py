@@ -3,20 +3,223 @@ Skill Gap Analysis Module
 Handles skill matching, gap analysis, and similarity calculations
 """
 
-from typing import Dict, List, Tuple
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
 
-class SkillAnalyzer:
-    """Skill gap analysis and matching engine"""
+from nlp_modules.skill_registry import SkillRegistry, SkillSet
+
+# scipy and scikit-learn are imported where they are first needed, so that
+# importing this module does not pay for them
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+
+class _SkillVocabulary:
+    """
+    Fitted TF-IDF vocabulary with role vectors and per-skill term weights
     
-    def __init__(self):
+    Everything is computed in the constructor and only read afterwards, so
+    one instance can be shared by concurrent threads.
+    """
+    
+    def __init__(self, role_skill_lists: List[List[str]], known_skills: Iterable[str]):
+        """
+        Fit the vocabulary on the required skills of every role
+        
+        Args:
+            role_skill_lists: Required skills of every role
+            known_skills: Skill names whose term weights are precomputed
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
         self.tfidf_vectorizer = TfidfVectorizer(
             ngram_range=(1, 2),
             stop_words='english',
             lowercase=True
         )
+        documents = [' '.join(skills) for skills in role_skill_lists]
+        role_matrix = self.tfidf_vectorizer.fit_transform(documents)
+        
+        self.analyzer = self.tfidf_vectorizer.build_analyzer()
+        self.size = len(self.tfidf_vectorizer.vocabulary_)
+        self.role_vectors: Dict[Tuple[str, ...], 'csr_matrix'] = {
+            tuple(skills): role_matrix[i] for i, skills in enumerate(role_skill_lists)
+        }
+        # Smoothed IDF of a term that occurs in no role document
+        self.unseen_idf = np.log(1 + len(documents)) + 1
+        
+        self.unseen_terms: Dict[str, int] = {}
+        self.skill_term_weights: Dict[str, Tuple[List[int], List[float]]] = {
+            skill: self._compute_term_weights(skill, self.unseen_terms, self.size)
+            for skill in known_skills
+        }
+    
+    def role_vector(self, required_skills: List[str]) -> 'csr_matrix':
+        """Return the L2-normalized TF-IDF vector of a required skill list"""
+        role_vector = self.role_vectors.get(tuple(required_skills))
+        if role_vector is None:
+            role_vector = self.tfidf_vectorizer.transform([' '.join(required_skills)])
+        return role_vector
+    
+    def term_weights(self, skill: str,
+                     extra_unseen_terms: Dict[str, int]) -> Tuple[List[int], List[float]]:
+        """
+        Return the term columns and TF-IDF weights of one skill name
+        
+        Args:
+            skill: Skill name
+            extra_unseen_terms: Caller-owned columns for unseen terms of
+                skills that were not precomputed; extended in place
+            
+        Returns:
+            Tuple of (columns, weights)
+        """
+        term_weights = self.skill_term_weights.get(skill)
+        if term_weights is None:
+            term_weights = self._compute_term_weights(
+                skill, extra_unseen_terms, self.size + len(self.unseen_terms)
+            )
+        return term_weights
+    
+    def _compute_term_weights(self, skill: str, unseen_terms: Dict[str, int],
+                              first_unseen_column: int) -> Tuple[List[int], List[float]]:
+        """
+        Weigh the terms of one skill name
+        
+        Terms outside the role vocabulary get columns past the vocabulary so
+        they still count towards the resume vector's norm; terms not in
+        self.unseen_terms are numbered in unseen_terms from first_unseen_column.
+        """
+        vocabulary = self.tfidf_vectorizer.vocabulary_
+        idf = self.tfidf_vectorizer.idf_
+        columns, weights = [], []
+        for term, count in Counter(self.analyzer(skill)).items():
+            column = vocabulary.get(term)
+            if column is None:
+                column = self.unseen_terms.get(term)
+                if column is None:
+                    column = unseen_terms.setdefault(term, first_unseen_column + len(unseen_terms))
+                weights.append(count * self.unseen_idf)
+            else:
+                weights.append(count * idf[column])
+            columns.append(column)
+        return columns, weights
+
+
+class SkillAnalyzer:
+    """Skill gap analysis and matching engine"""
+    
+    def __init__(self, job_roles: Optional[Dict[str, Dict]] = None, skill_registry=None):
+        """
+        Initialize the analyzer
+        
+        Args:
+            job_roles: Optional 'job_roles' section of job_skills.json; when
+                given, the similarity vocabulary and role vectors are built
+                once, otherwise each required skill list gets its own
+                vocabulary on first use
+            skill_registry: SkillRegistry of the skill database (built from
+                job_roles when omitted); matching runs on boolean skill sets
+                indexed by its integer skill IDs
+        """
+        if skill_registry is None and job_roles:
+            skill_registry = SkillRegistry({'technical_skills_database': {}, 'job_roles': job_roles})
+        self.skill_registry = skill_registry
+        self._vocabulary: Optional[_SkillVocabulary] = None
+        self._role_vocabularies: Dict[Tuple[str, ...], _SkillVocabulary] = {}
+        self._role_vocabularies_lock = threading.Lock()
+        
+        if job_roles:
+            self.fit_role_vocabulary([role['required_skills'] for role in job_roles.values()])
+    
+    def fit_role_vocabulary(self, role_skill_lists: List[List[str]]):
+        """
+        Fit the fixed similarity vocabulary and cache one vector per role
+        
+        Args:
+            role_skill_lists: Required skills of every role
+        """
+        known_skills = self._known_skills(role_skill_lists)
+        self._vocabulary = _SkillVocabulary(role_skill_lists, known_skills)
+    
+    def _known_skills(self, role_skill_lists: List[List[str]]) -> Iterable[str]:
+        """Skills whose term weights are precomputed: the registry, else the roles' skills"""
+        if self.skill_registry is not None:
+            return self.skill_registry.skill_names
+        return {skill for skills in role_skill_lists for skill in skills}
+    
+    def _get_vocabulary(self, required_skills: List[str]) -> _SkillVocabulary:
+        """
+        Return the vocabulary that scores a required skill list
+        
+        Without a role database, each list is scored in a vocabulary fitted
+        on that list alone, so a score does not depend on which roles were
+        scored before it.
+        """
+        if self._vocabulary is not None:
+            return self._vocabulary
+        key = tuple(required_skills)
+        vocabulary = self._role_vocabularies.get(key)
+        if vocabulary is None:
+            with self._role_vocabularies_lock:
+                vocabulary = self._role_vocabularies.get(key)
+                if vocabulary is None:
+                    vocabulary = _SkillVocabulary([required_skills], self._known_skills([required_skills]))
+                    self._role_vocabularies[key] = vocabulary
+        return vocabulary
+    
+    def _skill_sets(self, resume_skills: Union[SkillSet, Dict[str, float], Iterable[str]],
+                    required_skills: List[str]) -> Tuple[np.ndarray, SkillSet]:
+        """
+        Map a required skill list and the resume onto one skill registry
+        
+        The analyzer's registry is used when it holds every required skill;
+        otherwise (or without a registry) a registry of the required list
+        alone, so requirements outside the database still match resume
+        skills of the same name.
+        
+        Returns:
+            Tuple of (required skill IDs, resume SkillSet over the same registry)
+        """
+        registry = self.skill_registry
+        required_ids = registry.required_ids(required_skills) if registry is not None else None
+        if required_ids is None or (required_ids < 0).any():
+            registry = SkillRegistry.from_skills(required_skills)
+            required_ids = registry.required_ids(required_skills)
+        return required_ids, registry.skill_set(resume_skills)
+    
+    @staticmethod
+    def _required_labels(required_skills: List[str], required_ids: np.ndarray) -> List[str]:
+        """Label every requirement with the first spelling of its skill in the list"""
+        first_spelling: Dict[int, str] = {}
+        return [
+            first_spelling.setdefault(skill_id, skill)
+            for skill_id, skill in zip(required_ids.tolist(), required_skills)
+        ]
+    
+    @staticmethod
+    def _split_by_hits(labels: List[str], hits: np.ndarray) -> Tuple[List[str], List[str]]:
+        """Turn per-requirement hit flags into matched and missing skill labels"""
+        matched, missing = [], []
+        for label, hit in zip(labels, hits.tolist()):
+            (matched if hit else missing).append(label)
+        return matched, missing
+    
+    def _match_skills(self, resume_skills: Iterable[str],
+                      required_skills: List[str]) -> Tuple[List[str], List[str]]:
+        """Split required skills into matched and missing labels"""
+        required_ids, resume = self._skill_sets(resume_skills, required_skills)
+        return self._split_by_hits(
+            self._required_labels(required_skills, required_ids), resume.mask[required_ids]
+        )
+    
+    @staticmethod
+    def _match_percentage(matches: int, total_required: int) -> float:
+        """Percentage of required skills matched, rounded to two decimals"""
+        if not total_required:
+            return 0.0
+        return round((matches / total_required) * 100, 2)
     
     def calculate_skill_match_percentage(self, resume_skills: List[str], 
                                        required_skills: List[str]) -> float:
@@ -33,19 +236,9 @@ class SkillAnalyzer:
         if not required_skills:
             return 0.0
         
-        # Convert to lowercase for comparison
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        # Count matches
-        matches = 0
-        for req_skill in required_skills_lower:
-            if req_skill in resume_skills_lower:
-                matches += 1
-        
-        # Calculate percentage
-        match_percentage = (matches / len(required_skills)) * 100
-        return round(match_percentage, 2)
+        required_ids, resume = self._skill_sets(resume_skills, required_skills)
+        matches = int(np.count_nonzero(resume.mask[required_ids]))
+        return self._match_percentage(matches, len(required_skills))
     
     def find_matched_skills(self, resume_skills: List[str], 
                           required_skills: List[str]) -> List[str]:
@@ -59,19 +252,7 @@ class SkillAnalyzer:
         Returns:
             List of matched skills
         """
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        matched = []
-        for req_skill in required_skills_lower:
-            if req_skill in resume_skills_lower:
-                # Find the original case version
-                original_skill = next(
-                    (skill for skill in required_skills if skill.lower() == req_skill),
-                    req_skill
-                )
-                matched.append(original_skill)
-        
+        matched, _ = self._match_skills(resume_skills, required_skills)
         return matched
     
     def find_missing_skills(self, resume_skills: List[str], 
@@ -86,28 +267,16 @@ class SkillAnalyzer:
         Returns:
             List of missing skills
         """
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
-        
-        missing = []
-        for req_skill in required_skills_lower:
-            if req_skill not in resume_skills_lower:
-                # Find the original case version
-                original_skill = next(
-                    (skill for skill in required_skills if skill.lower() == req_skill),
-                    req_skill
-                )
-                missing.append(original_skill)
-        
+        _, missing = self._match_skills(resume_skills, required_skills)
         return missing
     
-    def calculate_skill_similarity_score(self, resume_skills: Dict[str, float], 
+    def calculate_skill_similarity_score(self, resume_skills: Union[SkillSet, Dict[str, float]], 
                                        required_skills: List[str]) -> float:
         """
         Calculate similarity score using TF-IDF and cosine similarity
         
         Args:
-            resume_skills: Dictionary of skills and their scores
+            resume_skills: SkillSet or dictionary of skills and their scores
             required_skills: List of required skills
             
         Returns:
@@ -116,56 +285,68 @@ class SkillAnalyzer:
         if not resume_skills or not required_skills:
             return 0.0
         
-        # Create text representations
-        resume_text = ' '.join([skill * int(score * 5) for skill, score in resume_skills.items()])
-        required_text = ' '.join(required_skills)
-        
-        if not resume_text.strip() or not required_text.strip():
-            return 0.0
-        
         try:
-            # Calculate TF-IDF vectors
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([resume_text, required_text])
+            vocabulary = self._get_vocabulary(required_skills)
+            role_vector = vocabulary.role_vector(required_skills)
+            
+            # Map the weighted resume skills straight onto the fixed vocabulary;
+            # unseen terms of skills outside the precomputed ones get columns
+            # local to this call, leaving the shared vocabulary untouched
+            columns, weights = [], []
+            extra_unseen_terms: Dict[str, int] = {}
+            for skill, score in resume_skills.items():
+                skill_columns, skill_weights = vocabulary.term_weights(skill, extra_unseen_terms)
+                columns.extend(skill_columns)
+                weights.extend(score * weight for weight in skill_weights)
+            
+            from scipy.sparse import csr_matrix
             
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            vocabulary_size = vocabulary.size
+            resume_vector = csr_matrix(
+                (weights, ([0] * len(columns), columns)),
+                shape=(1, vocabulary_size + len(vocabulary.unseen_terms) + len(extra_unseen_terms))
+            )
+            resume_vector.sum_duplicates()
+            resume_norm = np.linalg.norm(resume_vector.data)
+            if resume_norm == 0:
+                return 0.0
+            
+            # Cosine similarity (the role vector is already L2-normalized)
+            dot = (resume_vector[:, :vocabulary_size] @ role_vector.T)[0, 0]
+            similarity = dot / resume_norm
             
             return float(similarity)
             
         except Exception:
             return 0.0
     
-    def analyze_skill_gaps(self, resume_skills: Dict[str, float], 
+    def analyze_skill_gaps(self, resume_skills: Union[SkillSet, Dict[str, float]], 
                           required_skills: List[str]) -> Dict:
         """
         Perform comprehensive skill gap analysis
         
         Args:
-            resume_skills: Dictionary of skills and their scores
+            resume_skills: SkillSet (built once per resume) or dictionary of
+                skills and their scores
             required_skills: List of required skills
             
         Returns:
             Dictionary containing analysis results
         """
-        # Convert resume skills dict to list
-        resume_skill_list = list(resume_skills.keys())
+        required_ids, resume = self._skill_sets(resume_skills, required_skills)
         
-        # Calculate metrics
-        match_percentage = self.calculate_skill_match_percentage(resume_skill_list, required_skills)
-        matched_skills = self.find_matched_skills(resume_skill_list, required_skills)
-        missing_skills = self.find_missing_skills(resume_skill_list, required_skills)
-        similarity_score = self.calculate_skill_similarity_score(resume_skills, required_skills)
+        # One gather gives a hit flag per requirement; skill names are only
+        # attached to the results
+        hits = resume.mask[required_ids]
+        matched_skills, missing_skills = self._split_by_hits(
+            self._required_labels(required_skills, required_ids), hits
+        )
+        match_percentage = self._match_percentage(int(np.count_nonzero(hits)), len(required_skills))
         
         # Calculate skill strength for matched skills
-        skill_strengths = {}
-        for skill in matched_skills:
-            if skill.lower() in [s.lower() for s in resume_skills.keys()]:
-                # Find the skill in resume_skills (case-insensitive)
-                resume_skill = next(
-                    (s for s in resume_skills.keys() if s.lower() == skill.lower()),
-                    skill
-                )
-                skill_strengths[skill] = resume_skills.get(resume_skill, 0.0)
+        skill_strengths = dict(zip(matched_skills, resume.scores[required_ids[hits]].tolist()))
+        
+        similarity_score = self.calculate_skill_similarity_score(resume_skills, required_skills)
         
         # Determine proficiency level
         if match_percentage >= 80:
@@ -231,14 +412,14 @@ class SkillAnalyzer:
         
         return recommendations
     
-    def get_skill_category_analysis(self, resume_skills: Dict[str, float], 
+    def get_skill_category_analysis(self, resume_skills: Union[SkillSet, Dict[str, float]], 
                                   required_skills: List[str],
                                   skill_categories: Dict[str, List[str]]) -> Dict:
         """
         Analyze skills by category
         
         Args:
-            resume_skills: Dictionary of skills and their scores
+            resume_skills: SkillSet or dictionary of skills and their scores
             required_skills: List of required skills
             skill_categories: Dictionary of skill categories
             
@@ -246,28 +427,130 @@ class SkillAnalyzer:
             Category-wise analysis
         """
         category_analysis = {}
+        required_ids, resume = self._skill_sets(resume_skills, required_skills)
+        hits = resume.mask[required_ids]
+        labels = self._required_labels(required_skills, required_ids)
         
         for category, category_skills in skill_categories.items():
-            # Find required skills in this category
-            required_in_category = [skill for skill in required_skills if skill in category_skills]
+            # Per requirement: in this category, and in this category AND matched
+            in_category = resume.registry.category_mask(category, category_skills)[required_ids]
+            total_required = int(np.count_nonzero(in_category))
+            if not total_required:
+                continue
+            total_matched = int(np.count_nonzero(in_category & hits))
+            
+            required_in_category = [label for label, inside in zip(labels, in_category.tolist()) if inside]
+            matched_in_category, missing_in_category = self._split_by_hits(
+                required_in_category, hits[in_category]
+            )
             
-            if required_in_category:
-                # Find matched skills in this category
-                resume_skill_list = list(resume_skills.keys())
-                matched_in_category = self.find_matched_skills(resume_skill_list, required_in_category)
-                
-                # Calculate category match percentage
-                category_match = self.calculate_skill_match_percentage(
-                    matched_in_category, required_in_category
-                )
-                
-                category_analysis[category] = {
-                    'required_skills': required_in_category,
-                    'matched_skills': matched_in_category,
-                    'missing_skills': self.find_missing_skills(matched_in_category, required_in_category),
-                    'match_percentage': category_match,
-                    'total_required': len(required_in_category),
-                    'total_matched': len(matched_in_category)
-                }
+            category_analysis[category] = {
+                'required_skills': required_in_category,
+                'matched_skills': matched_in_category,
+                'missing_skills': missing_in_category,
+                'match_percentage': self._match_percentage(total_matched, total_required),
+                'total_required': total_required,
+                'total_matched': total_matched
+            }
         
         return category_analysis
+
+
+class RoleSkillMatrix:
+    """Sparse role x skill incidence matrix for scoring resumes against every role at once"""
+    
+    def __init__(self, job_roles: Dict[str, Dict], skill_registry: Optional[SkillRegistry] = None):
+        """
+        Build the incidence matrix from the job roles database
+        
+        Args:
+            job_roles: The 'job_roles' section of job_skills.json
+            skill_registry: SkillRegistry whose IDs are the matrix columns
+                (built from job_roles when omitted)
+        """
+        from scipy.sparse import csr_matrix
+        
+        if skill_registry is None:
+            skill_registry = SkillRegistry({'technical_skills_database': {}, 'job_roles': job_roles})
+        self.skill_registry = skill_registry
+        self.role_names = list(job_roles.keys())
+        
+        rows, cols = [], []
+        self.required_counts = np.zeros(len(self.role_names), dtype=np.int64)
+        for role_id, role_data in enumerate(job_roles.values()):
+            skill_ids = skill_registry.required_ids(role_data['required_skills'])
+            self.required_counts[role_id] = len(skill_ids)
+            # Skills missing from the registry count as required but never match
+            skill_ids = skill_ids[skill_ids >= 0]
+            rows.extend([role_id] * len(skill_ids))
+            cols.extend(skill_ids.tolist())
+        
+        # Duplicate entries are summed, so a skill listed twice counts twice
+        self.matrix = csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(self.role_names), len(skill_registry))
+        )
+    
+    def _resume_matrix(self, resume_skill_batch: List[Union[SkillSet, Iterable[str]]]) -> 'csr_matrix':
+        """Binary resume x skill matrix over the registry's skill IDs"""
+        from scipy.sparse import csr_matrix
+        
+        skill_ids = [self.skill_registry.skill_set(resume_skills).ids() for resume_skills in resume_skill_batch]
+        indptr = np.zeros(len(skill_ids) + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in skill_ids], out=indptr[1:])
+        indices = np.concatenate(skill_ids) if skill_ids else np.empty(0, dtype=np.intp)
+        
+        return csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(resume_skill_batch), len(self.skill_registry))
+        )
+    
+    def score(self, resume_skill_batch: List[Union[SkillSet, Iterable[str]]]) -> Dict[str, np.ndarray]:
+        """
+        Score a batch of resumes against every role with one sparse product
+        
+        Args:
+            resume_skill_batch: SkillSet, skill names or skill score dict per resume
+            
+        Returns:
+            Dictionary of (resumes x roles) arrays: 'matched', 'missing' and
+            'match_percentage'
+        """
+        matched = (self._resume_matrix(resume_skill_batch) @ self.matrix.T).toarray()
+        required = self.required_counts[np.newaxis, :]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentage = np.where(required > 0, matched / required * 100, 0.0)
+        
+        return {
+            'matched': matched,
+            'missing': required - matched,
+            'match_percentage': percentage
+        }
+    
+    def best_fit_roles(self, resume_skills: Union[SkillSet, Iterable[str]],
+                       top_n: Optional[int] = None) -> List[Dict]:
+        """
+        Rank every job role by how well a resume covers its required skills
+        
+        Args:
+            resume_skills: Skills extracted from resume (SkillSet, names or score dict)
+            top_n: Number of roles to return (all roles if None)
+            
+        Returns:
+            List of role summaries sorted by descending match percentage
+        """
+        scores = self.score([resume_skills])
+        percentage = scores['match_percentage'][0]
+        order = np.argsort(-percentage, kind='stable')[:top_n]
+        
+        return [
+            {
+                'job_role': self.role_names[role_id],
+                'match_percentage': round(float(percentage[role_id]), 2),
+                'total_required_skills': int(self.required_counts[role_id]),
+                'total_matched_skills': int(scores['matched'][0, role_id]),
+                'total_missing_skills': int(scores['missing'][0, role_id])
+            }
+            for role_id in order
+        ]
@@ -0,0 +1,83 @@
+"""
+Streamlit Extraction Adapter
+Runs the Streamlit-free extraction core and reports its messages in the UI
+"""
+
+from typing import Optional
+import streamlit as st
+
+from utils.pdf_extractor import ExtractionResult, PDFExtractor
+from utils.single_flight import get_single_flight
+from utils.upload_buffer import UploadBuffer
+
+
+def report_extraction_result(result: ExtractionResult) -> Optional[str]:
+    """
+    Show an extraction result's error and warnings in the Streamlit UI
+
+    Args:
+        result: Result returned by the extraction core
+
+    Returns:
+        Extracted text or None if extraction failed
+    """
+    if result.error is not None:
+        st.error(result.error)
+        return None
+    for warning in result.warnings:
+        st.warning(f"⚠️ {warning}")
+    return result.text
+
+
+class StreamlitPDFExtractor(PDFExtractor):
+    """PDFExtractor that reports errors and warnings with Streamlit"""
+
+    @staticmethod
+    def extract_text_from_pdf(pdf_file, **pdf_options) -> Optional[str]:
+        """
+        Extract text from PDF file
+
+        Args:
+            pdf_file: Uploaded PDF file
+            **pdf_options: Limits passed on to PDFExtractor.extract_pdf
+
+        Returns:
+            Extracted text or None if extraction fails
+        """
+        return report_extraction_result(PDFExtractor.extract_pdf(pdf_file, **pdf_options))
+
+    @staticmethod
+    def extract_text_from_uploaded_file(uploaded_file) -> Optional[str]:
+        """
+        Extract text from uploaded file (PDF or text)
+
+        Args:
+            uploaded_file: Streamlit uploaded file object
+
+        Returns:
+            Extracted text or None if extraction fails
+        """
+        if uploaded_file is None:
+            return None
+        return report_extraction_result(PDFExtractor.extract_uploaded_file(uploaded_file))
+
+    @staticmethod
+    def extract_text_from_buffer(upload: UploadBuffer, flight_key: Optional[str] = None) -> Optional[str]:
+        """
+        Extract text from an upload that has already been read once
+
+        Args:
+            upload: Buffer holding the uploaded file
+            flight_key: Optional key (e.g. the result cache key); concurrent
+                calls with the same key share one extraction through the
+                'resume_text' single flight, and every session reports the
+                shared result's error and warnings itself
+
+        Returns:
+            Extracted text or None if extraction fails
+        """
+        if flight_key is None:
+            result = PDFExtractor.extract_buffer(upload)
+        else:
+            result = get_single_flight('resume_text').do(flight_key, lambda: PDFExtractor.extract_buffer(upload))
+        return report_extraction_result(result)
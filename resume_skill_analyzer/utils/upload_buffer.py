@@ -0,0 +1,176 @@
+"""
+Upload Buffer Module
+Reads an upload once and shares the bytes for hashing, type sniffing and decoding
+"""
+
+import codecs
+import hashlib
+import io
+from typing import Optional, Tuple
+
+# Try to import charset_normalizer for encoding detection, fall back to cp1252/latin-1
+try:
+    import charset_normalizer
+    CHARSET_DETECTION_AVAILABLE = True
+except ImportError:
+    CHARSET_DETECTION_AVAILABLE = False
+
+PDF_TYPE = 'application/pdf'
+TEXT_TYPE = 'text/plain'
+BINARY_TYPE = 'application/octet-stream'
+
+SNIFF_BYTES = 8192
+
+# Byte order marks, longest first (the UTF-32 LE mark starts with the UTF-16 LE one)
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Magic numbers of common binary formats that are not supported
+_BINARY_SIGNATURES = (
+    (b'PK\x03\x04', 'application/zip'),
+    (b'\xd0\xcf\x11\xe0', 'application/msword'),
+    (b'\x89PNG', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF8', 'image/gif'),
+    (b'{\\rtf', 'application/rtf'),
+)
+
+
+class UploadBuffer:
+    """The bytes of one upload, read exactly once and exposed as a memoryview"""
+
+    def __init__(self, data, source=None, declared_type: Optional[str] = None,
+                 name: Optional[str] = None):
+        """
+        Wrap already-read upload bytes
+
+        Args:
+            data: bytes-like object holding the whole upload
+            source: Seekable file object the bytes came from, reused for
+                parsers that need a stream
+            declared_type: MIME type reported by the client (see declares_pdf)
+            name: File name reported by the client (see declares_pdf)
+        """
+        self.view = memoryview(data).cast('B')
+        self.source = source
+        self.declared_type = declared_type
+        self.name = name
+        self._hash: Optional[str] = None
+        self._sniffed_type: Optional[str] = None
+
+    @classmethod
+    def from_upload(cls, uploaded_file) -> 'UploadBuffer':
+        """
+        Read an upload once
+
+        For an unmodified io.BytesIO (including Streamlit's UploadedFile),
+        CPython's getvalue() returns the bytes object the upload was built
+        from, so nothing is copied; other file objects are read once.
+
+        Args:
+            uploaded_file: Binary file object
+
+        Returns:
+            UploadBuffer over the upload's bytes
+        """
+        declared_type = getattr(uploaded_file, 'type', None)
+        name = getattr(uploaded_file, 'name', None)
+        if isinstance(uploaded_file, io.BytesIO):
+            return cls(uploaded_file.getvalue(), uploaded_file, declared_type, name)
+        uploaded_file.seek(0)
+        return cls(uploaded_file.read(), None, declared_type, name)
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def content_hash(self) -> str:
+        """Return the SHA-256 hex digest of the upload, as result_cache.content_hash does"""
+        if self._hash is None:
+            self._hash = hashlib.sha256(self.view).hexdigest()
+        return self._hash
+
+    def stream(self):
+        """
+        Return a binary stream positioned at the start of the upload
+
+        Reuses the source file object when there is one, so parsers such as
+        PyPDF2 read the upload without another copy.
+        """
+        if self.source is not None:
+            self.source.seek(0)
+            return self.source
+        return io.BytesIO(self.view)
+
+    def sniff_type(self) -> str:
+        """
+        Detect the file type from its leading bytes, ignoring the declared type
+
+        Returns:
+            PDF_TYPE, TEXT_TYPE, or the MIME type of an unsupported format
+        """
+        if self._sniffed_type is None:
+            self._sniffed_type = self._sniff_type()
+        return self._sniffed_type
+
+    def declares_pdf(self) -> bool:
+        """Return True if the client's MIME type or file extension says PDF"""
+        if self.declared_type == PDF_TYPE:
+            return True
+        return isinstance(self.name, str) and self.name.lower().endswith('.pdf')
+
+    def _sniff_type(self) -> str:
+        head = bytes(self.view[:SNIFF_BYTES])
+
+        # PDF readers accept the header anywhere in the first kilobyte
+        if b'%PDF-' in head[:1024]:
+            return PDF_TYPE
+        if any(head.startswith(bom) for bom, _ in _BOMS):
+            return TEXT_TYPE
+        for signature, mime_type in _BINARY_SIGNATURES:
+            if head.startswith(signature):
+                return mime_type
+        if b'\x00' in head:
+            return BINARY_TYPE
+        return TEXT_TYPE
+
+    def decode_text(self) -> Tuple[str, str]:
+        """
+        Decode the upload as text
+
+        Honors a byte order mark, then tries strict UTF-8, then charset
+        detection, and finally cp1252 and latin-1 (which never fails).
+
+        Returns:
+            Tuple of (text, encoding used)
+        """
+        view = self.view
+        for bom, encoding in _BOMS:
+            if view[:len(bom)] == bom:
+                return str(view, encoding), encoding
+
+        try:
+            return str(view, 'utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            pass
+
+        if CHARSET_DETECTION_AVAILABLE:
+            # Short samples fit several single-byte code pages; prefer the
+            # Windows Western one whenever it is among the plausible matches
+            matches = charset_normalizer.from_bytes(bytes(view[:SNIFF_BYTES * 8]))
+            encodings = [match.encoding for match in matches]
+            encodings.sort(key=lambda encoding: encoding != 'cp1252')
+            for encoding in encodings:
+                try:
+                    return str(view, encoding), encoding
+                except (UnicodeDecodeError, LookupError):
+                    continue
+
+        try:
+            return str(view, 'cp1252'), 'cp1252'
+        except UnicodeDecodeError:
+            return str(view, 'latin-1'), 'latin-1'
@@ -0,0 +1,101 @@
+"""
+Worker Pool Module
+Process pool whose workers share one analysis engine built in the parent
+
+With the fork start method the parent builds and warms the engine once,
+then every worker (including the replacements for recycled workers) is
+forked with the engine already in memory and shares its pages
+copy-on-write. Where fork is unavailable, each worker builds its own engine
+in the pool initializer.
+"""
+
+import gc
+import multiprocessing
+import os
+from typing import Callable, Iterable, Iterator, Optional
+
+from utils.analysis_engine import AnalysisEngine, get_analysis_engine
+
+# Tasks a worker runs before it is replaced, bounding per-worker memory growth
+DEFAULT_MAX_TASKS_PER_CHILD = 200
+
+FORK_AVAILABLE = 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _init_engine_worker(job_skills_path: str, initializer: Optional[Callable], initargs: tuple):
+    """Pool initializer: reuse the inherited engine, or build one under spawn"""
+    get_analysis_engine(job_skills_path)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class EngineWorkerPool:
+    """multiprocessing.Pool with a pre-warmed, copy-on-write shared AnalysisEngine"""
+
+    def __init__(self, job_skills_path: str, workers: Optional[int] = None,
+                 max_tasks_per_child: Optional[int] = DEFAULT_MAX_TASKS_PER_CHILD,
+                 initializer: Optional[Callable] = None, initargs: tuple = ()):
+        """
+        Build the engine and start the workers
+
+        Args:
+            job_skills_path: Path to job_skills.json file
+            workers: Number of worker processes (defaults to the CPU count)
+            max_tasks_per_child: Tasks after which a worker is replaced
+                (None keeps workers for the life of the pool)
+            initializer: Optional function run once in every worker
+            initargs: Arguments for the initializer
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.start_method = 'fork' if FORK_AVAILABLE else 'spawn'
+        self.engine: Optional[AnalysisEngine] = None
+
+        if FORK_AVAILABLE:
+            self.engine = get_analysis_engine(job_skills_path)
+            self.engine.warm_up()
+            # Move the engine out of the collector's view so collections in the
+            # workers do not write to, and so copy, the shared pages
+            gc.collect()
+            gc.freeze()
+
+        self._pool = multiprocessing.get_context(self.start_method).Pool(
+            self.workers,
+            initializer=_init_engine_worker,
+            initargs=(job_skills_path, initializer, initargs),
+            maxtasksperchild=max_tasks_per_child,
+        )
+
+    def imap_unordered(self, func: Callable, iterable: Iterable, chunksize: int = 1) -> Iterator:
+        """Apply func to every item, yielding results in completion order"""
+        return self._pool.imap_unordered(func, iterable, chunksize)
+
+    def imap(self, func: Callable, iterable: Iterable, chunksize: int = 1) -> Iterator:
+        """Apply func to every item, yielding results in input order"""
+        return self._pool.imap(func, iterable, chunksize)
+
+    def apply_async(self, func: Callable, args: tuple = (), callback=None, error_callback=None):
+        """Run func(*args) in a worker and return its AsyncResult"""
+        return self._pool.apply_async(func, args, callback=callback, error_callback=error_callback)
+
+    def close(self):
+        """Stop accepting tasks and wait for the workers to finish"""
+        self._pool.close()
+        self._pool.join()
+        if self.start_method == 'fork':
+            gc.unfreeze()
+
+    def terminate(self):
+        """Stop the workers immediately"""
+        self._pool.terminate()
+        self._pool.join()
+        if self.start_method == 'fork':
+            gc.unfreeze()
+
+    def __enter__(self) -> 'EngineWorkerPool':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()